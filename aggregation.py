@@ -0,0 +1,126 @@
+"""Накопительные итоги тренировок по пользователям, дням и типам."""
+from dataclasses import astuple, dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from homework import InfoMessage, Training
+
+Snapshot = Dict[Tuple[str, str, str], Tuple[int, float, float, float]]
+
+
+@dataclass
+class Totals:
+    """Суммы показателей группы тренировок."""
+
+    count: int = 0
+    duration: float = 0.0
+    distance: float = 0.0
+    calories: float = 0.0
+
+    def add(self, info: InfoMessage) -> None:
+        """Учесть одну тренировку."""
+        self.count += 1
+        self.duration += info.duration
+        self.distance += info.distance
+        self.calories += info.calories
+
+    def remove(self, info: InfoMessage) -> None:
+        """Исключить ранее учтённую тренировку."""
+        self.count -= 1
+        self.duration -= info.duration
+        self.distance -= info.distance
+        self.calories -= info.calories
+
+    def merge(self, other: 'Totals') -> None:
+        """Прибавить суммы другой группы."""
+        self.count += other.count
+        self.duration += other.duration
+        self.distance += other.distance
+        self.calories += other.calories
+
+
+class Aggregator:
+    """Итоги по дням, обновляемые за O(1) на каждую тренировку.
+
+    Итоги за окно из нескольких дней складываются из дневных, поэтому
+    запрос за неделю читает не больше семи корзин на тип тренировки.
+    Снимки - обычные словари, их можно передавать между процессами и
+    объединять через `merge`.
+    """
+
+    def __init__(self) -> None:
+        self.users: Dict[str, Dict[date, Dict[str, Totals]]] = {}
+
+    def bucket(self, user: str, day: date, training_type: str) -> Totals:
+        """Дневные итоги пользователя по типу, создаются при отсутствии."""
+        types = self.users.setdefault(user, {}).setdefault(day, {})
+        if training_type not in types:
+            types[training_type] = Totals()
+        return types[training_type]
+
+    def add(self, user: str, day: date, info: InfoMessage) -> None:
+        """Учесть сообщение о тренировке пользователя за день."""
+        self.bucket(user, day, info.training_type).add(info)
+
+    def add_training(self, user: str, day: date, training: Training) -> None:
+        """Рассчитать тренировку и учесть её."""
+        self.add(user, day, training.show_training_info())
+
+    def replace(self, user: str, day: date, old: InfoMessage,
+                new: InfoMessage) -> None:
+        """Заменить учтённое сообщение пересчитанным, изменив итоги."""
+        self.bucket(user, day, old.training_type).remove(old)
+        self.bucket(user, day, new.training_type).add(new)
+
+    def day_totals(self, user: str, day: date,
+                   training_type: Optional[str] = None) -> Totals:
+        """Итоги пользователя за день, по одному типу или по всем."""
+        return self.window_totals(user, day, 1, training_type)
+
+    def window_totals(self, user: str, end: date, days: int = 7,
+                      training_type: Optional[str] = None) -> Totals:
+        """Итоги пользователя за `days` дней, заканчивая днём `end`."""
+        totals = Totals()
+        days_totals = self.users.get(user, {})
+        for offset in range(days):
+            types = days_totals.get(end - timedelta(days=offset), {})
+            for bucket_type, bucket in types.items():
+                if training_type in (None, bucket_type):
+                    totals.merge(bucket)
+        return totals
+
+    def expire(self, before: date) -> None:
+        """Удалить дневные итоги старше `before`."""
+        for user in list(self.users):
+            days_totals = self.users[user]
+            for day in [day for day in days_totals if day < before]:
+                del days_totals[day]
+            if not days_totals:
+                del self.users[user]
+
+    def items(self) -> Iterator[Tuple[str, date, str, Totals]]:
+        """Перебрать все дневные итоги."""
+        for user, days_totals in self.users.items():
+            for day, types in days_totals.items():
+                for training_type, totals in types.items():
+                    yield user, day, training_type, totals
+
+    def snapshot(self) -> Snapshot:
+        """Вернуть итоги в виде словаря простых значений."""
+        return {(user, day.isoformat(), training_type): astuple(totals)
+                for user, day, training_type, totals in self.items()}
+
+    def merge(self, other: Union['Aggregator', Snapshot]) -> None:
+        """Прибавить итоги другого агрегатора или его снимка."""
+        if isinstance(other, Aggregator):
+            other = other.snapshot()
+        for (user, day, training_type), values in other.items():
+            self.bucket(user, date.fromisoformat(day),
+                        training_type).merge(Totals(*values))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot) -> 'Aggregator':
+        """Восстановить агрегатор из снимка."""
+        aggregator = cls()
+        aggregator.merge(snapshot)
+        return aggregator
@@ -0,0 +1,228 @@
+"""Пакетный расчёт показателей тренировок по столбцам данных."""
+from array import array
+from dataclasses import fields
+from typing import (Callable, Dict, Iterable, Iterator, List, Mapping,
+                    Sequence, Tuple, Type)
+
+from homework import (WORKOUT_ARITY, WORKOUT_TYPES, InfoMessage, Running,
+                      SportsWalking, Swimming, Training)
+
+Columns = Mapping[str, Sequence[float]]
+Results = Dict[str, List[float]]
+
+
+def _distance(cls: Type[Training], columns: Columns) -> List[float]:
+    """Дистанция в км по формуле `Training.get_distance`."""
+    len_step = cls.LEN_STEP
+    m_in_km = cls.M_IN_KM
+    return [action * len_step / m_in_km for action in columns['action']]
+
+
+def _mean_speed(cls: Type[Training], columns: Columns,
+                distance: List[float]) -> List[float]:
+    """Средняя скорость по формуле `Training.get_mean_speed`."""
+    return [dist / duration
+            for dist, duration in zip(distance, columns['duration'])]
+
+
+def _swimming_mean_speed(cls: Type[Training], columns: Columns,
+                         distance: List[float]) -> List[float]:
+    """Средняя скорость по формуле `Swimming.get_mean_speed`."""
+    m_in_km = cls.M_IN_KM
+    return [length_pool * count_pool / m_in_km / duration
+            for length_pool, count_pool, duration
+            in zip(columns['length_pool'], columns['count_pool'],
+                   columns['duration'])]
+
+
+def _running_calories(cls: Type[Training], columns: Columns,
+                      speed: List[float]) -> List[float]:
+    """Калории по формуле `Running.get_spent_calories`."""
+    coeff1 = cls.RUN_SPEED_COEFF1
+    coeff2 = cls.RUN_SPEED_COEFF2
+    m_in_km = cls.M_IN_KM
+    min_in_hour = cls.MIN_IN_HOUR
+    return [(coeff1 * mean_speed - coeff2) * weight / m_in_km
+            * duration * min_in_hour
+            for mean_speed, weight, duration
+            in zip(speed, columns['weight'], columns['duration'])]
+
+
+def _walking_calories(cls: Type[Training], columns: Columns,
+                      speed: List[float]) -> List[float]:
+    """Калории по формуле `SportsWalking.get_spent_calories`."""
+    coef1 = cls.WALK_WEIGHT_COEF1
+    coef2 = cls.WALK_WEIGHT_COEF2
+    square = cls.WALK_SQUARE
+    min_in_hour = cls.MIN_IN_HOUR
+    return [(coef1 * weight
+             + (mean_speed**square // height) * coef2 * weight)
+            * duration * min_in_hour
+            for mean_speed, weight, height, duration
+            in zip(speed, columns['weight'], columns['height'],
+                   columns['duration'])]
+
+
+def _swimming_calories(cls: Type[Training], columns: Columns,
+                       speed: List[float]) -> List[float]:
+    """Калории по формуле `Swimming.get_spent_calories`."""
+    add_speed = cls.ADD_SPEED
+    coef = cls.WEIGHT_SWIM_COEF
+    return [(mean_speed + add_speed) * coef * weight
+            for mean_speed, weight in zip(speed, columns['weight'])]
+
+
+SpeedFormula = Callable[[Type[Training], Columns, List[float]], List[float]]
+CaloriesFormula = Callable[[Type[Training], Columns, List[float]],
+                           List[float]]
+
+FORMULAS: Dict[Type[Training], Tuple[SpeedFormula, CaloriesFormula]] = {
+    Running: (_mean_speed, _running_calories),
+    SportsWalking: (_mean_speed, _walking_calories),
+    Swimming: (_swimming_mean_speed, _swimming_calories),
+}  # класс тренировки: (формула скорости, формула калорий)
+
+
+def get_formulas(training_class: Type[Training]
+                 ) -> Tuple[SpeedFormula, CaloriesFormula]:
+    """Найти столбцовые формулы для класса тренировки или его предка."""
+    for cls in training_class.__mro__:
+        if cls in FORMULAS:
+            return FORMULAS[cls]
+    raise NotImplementedError(f'Не используем пакетный расчет '
+                              f'для {training_class.__name__}')
+
+
+def check_columns(training_class: Type[Training], columns: Columns) -> int:
+    """Проверить набор столбцов и вернуть количество тренировок."""
+    names = [field.name for field in fields(training_class)]
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise TypeError(f'В данных тренировки {training_class.__name__} '
+                        f'не хватает столбцов: {", ".join(missing)}.')
+    lengths = {len(columns[name]) for name in names}
+    if len(lengths) > 1:
+        raise TypeError(f'Столбцы тренировки {training_class.__name__} '
+                        f'имеют разную длину: {sorted(lengths)}.')
+    return lengths.pop()
+
+
+def compute_batch(workout_type: str, columns: Columns) -> Results:
+    """Рассчитать дистанцию, скорость и калории для столбцов тренировок."""
+    if workout_type not in WORKOUT_TYPES:
+        raise ValueError(workout_type)
+    return compute_class_batch(WORKOUT_TYPES[workout_type], columns)
+
+
+def compute_class_batch(training_class: Type[Training],
+                        columns: Columns) -> Results:
+    """Рассчитать показатели столбцов для заданного класса тренировки."""
+    speed_formula, calories_formula = get_formulas(training_class)
+    check_columns(training_class, columns)
+    distance = _distance(training_class, columns)
+    speed = speed_formula(training_class, columns, distance)
+    return {
+        'duration': list(columns['duration']),
+        'distance': distance,
+        'speed': speed,
+        'calories': calories_formula(training_class, columns, speed)
+    }
+
+
+def batch_training_info(workout_type: str,
+                        columns: Columns) -> List[InfoMessage]:
+    """Вернуть информационные сообщения для столбцов тренировок."""
+    results = compute_batch(workout_type, columns)
+    return results_to_info(WORKOUT_TYPES[workout_type], results)
+
+
+def results_to_info(training_class: Type[Training],
+                    results: Results) -> List[InfoMessage]:
+    """Собрать информационные сообщения из рассчитанных столбцов."""
+    training_type = training_class.__name__
+    return [InfoMessage(training_type, *values)
+            for values in zip(results['duration'], results['distance'],
+                              results['speed'], results['calories'])]
+
+
+def packages_to_columns(workout_type: str,
+                        packages: Sequence[Sequence[float]]) -> Results:
+    """Разложить список пакетов одного типа по столбцам."""
+    if workout_type not in WORKOUT_TYPES:
+        raise ValueError(workout_type)
+    names = [field.name for field in fields(WORKOUT_TYPES[workout_type])]
+    for data in packages:
+        if len(data) != WORKOUT_ARITY[workout_type]:
+            raise TypeError(f'В данных тренировки {workout_type} передано '
+                            f'неверное количество элементов: {len(data)} '
+                            f'вместо {WORKOUT_ARITY[workout_type]}.')
+    if not packages:
+        return {name: [] for name in names}
+    return {name: list(column)
+            for name, column in zip(names, zip(*packages))}
+
+
+class TrainingArray:
+    """Компактное хранилище тренировок одного типа по столбцам.
+
+    Каждое поле тренировки хранится в отдельном `array('d')`, объекты
+    `Training` создаются только при обращении к отдельной записи.
+    """
+
+    def __init__(self, workout_type: str,
+                 packages: Iterable[Sequence[float]] = ()) -> None:
+        if workout_type not in WORKOUT_TYPES:
+            raise ValueError(workout_type)
+        self.workout_type = workout_type
+        self.training_class = WORKOUT_TYPES[workout_type]
+        self.names = tuple(field.name
+                           for field in fields(self.training_class))
+        self.columns: Dict[str, array] = {name: array('d')
+                                          for name in self.names}
+        self.extend(packages)
+
+    def __len__(self) -> int:
+        return len(self.columns['action'])
+
+    def __getitem__(self, index: int) -> Training:
+        return self.training_class(*(self.columns[name][index]
+                                     for name in self.names))
+
+    def __iter__(self) -> Iterator[Training]:
+        for values in zip(*(self.columns[name] for name in self.names)):
+            yield self.training_class(*values)
+
+    def append(self, data: Sequence[float]) -> None:
+        """Добавить пакет данных тренировки."""
+        if len(data) != len(self.names):
+            raise TypeError(f'В данных тренировки {self.workout_type} '
+                            f'передано неверное количество элементов: '
+                            f'{len(data)} вместо {len(self.names)}.')
+        row = array('d', data)  # проверить всю строку до записи
+        for name, value in zip(self.names, row):
+            self.columns[name].append(value)
+
+    def extend(self, packages: Iterable[Sequence[float]]) -> None:
+        """Добавить несколько пакетов данных тренировки."""
+        for data in packages:
+            self.append(data)
+
+    def compute(self) -> Results:
+        """Рассчитать показатели всех тренировок."""
+        return compute_class_batch(self.training_class, self.columns)
+
+    def get_distance(self) -> List[float]:
+        """Получить дистанции в км."""
+        return _distance(self.training_class, self.columns)
+
+    def get_mean_speed(self) -> List[float]:
+        """Получить средние скорости движения."""
+        return self.compute()['speed']
+
+    def get_spent_calories(self) -> List[float]:
+        """Получить количество затраченных калорий."""
+        return self.compute()['calories']
+
+    def show_training_info(self) -> List[InfoMessage]:
+        """Вернуть информационные сообщения о тренировках."""
+        return results_to_info(self.training_class, self.compute())
@@ -0,0 +1,65 @@
+"""Сравнение пакетного расчёта с расчётом по объектам."""
+import argparse
+import random
+import time
+
+from batch import compute_batch, packages_to_columns
+from homework import read_package
+
+ARITY = {'SWM': 5, 'RUN': 3, 'WLK': 4}
+
+
+def make_packages(count: int, seed: int = 0) -> dict:
+    """Сгенерировать пакеты каждого типа тренировки."""
+    rnd = random.Random(seed)
+    return {
+        workout_type: [[rnd.randint(100, 30000)]
+                       + [rnd.uniform(0.5, 120) for _ in range(arity - 1)]
+                       for _ in range(count)]
+        for workout_type, arity in ARITY.items()
+    }
+
+
+def per_object(packages: dict) -> list:
+    """Цикл из `__main__`: объект на каждый пакет."""
+    return [read_package(workout_type, data).show_training_info()
+            for workout_type, items in packages.items()
+            for data in items]
+
+
+def per_batch(columns: dict) -> list:
+    """Один пакетный расчёт на тип тренировки."""
+    return [compute_batch(workout_type, type_columns)
+            for workout_type, type_columns in columns.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=200_000,
+                        help='количество пакетов каждого типа')
+    args = parser.parse_args()
+    packages = make_packages(args.count)
+    columns = {workout_type: packages_to_columns(workout_type, items)
+               for workout_type, items in packages.items()}
+
+    start = time.perf_counter()
+    infos = per_object(packages)
+    objects_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = per_batch(columns)
+    batch_time = time.perf_counter() - start
+
+    calories = [value for result in results for value in result['calories']]
+    assert calories == [info.calories for info in infos]
+    total = len(infos)
+    print(f'пакетов: {total}')
+    print(f'по объектам: {objects_time:.3f} с '
+          f'({total / objects_time:,.0f} пакетов/с)')
+    print(f'пакетно:     {batch_time:.3f} с '
+          f'({total / batch_time:,.0f} пакетов/с)')
+    print(f'ускорение:   {objects_time / batch_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Повторы пакетов от устройств: расчёт каждого пакета против LRU-кэша."""
+import argparse
+import random
+import time
+
+from benchmarks.bench_batch import make_packages
+from cache import PackageCache
+from homework import read_package
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=300_000,
+                        help='всего пакетов')
+    parser.add_argument('-r', '--repeats', type=int, default=4,
+                        help='повторов на каждый уникальный пакет')
+    parser.add_argument('-w', '--window', type=int, default=100,
+                        help='повторы берутся из последних N пакетов')
+    parser.add_argument('-e', '--entries', type=int, default=10_000,
+                        help='размер кэша в записях')
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    unique = [(workout_type, data)
+              for workout_type, items in make_packages(
+                  args.count // (args.repeats + 1) // 3).items()
+              for data in items]
+    rnd.shuffle(unique)
+    packages = []
+    for position, package in enumerate(unique):
+        recent = unique[max(0, position - args.window + 1):position + 1]
+        packages.append(package)
+        packages.extend(rnd.choice(recent) for _ in range(args.repeats))
+
+    print(f'пакетов: {len(packages)}; уникальных: {len(unique)}')
+    for name, render in [('InfoMessage', False), ('текст сообщения', True)]:
+        start = time.perf_counter()
+        for workout_type, data in packages:
+            info = read_package(workout_type, data).show_training_info()
+            if render:
+                info.get_message()
+        plain_time = time.perf_counter() - start
+
+        cache = PackageCache(max_entries=args.entries)
+        get = cache.get_message if render else cache.get_info
+        start = time.perf_counter()
+        for workout_type, data in packages:
+            get(workout_type, data)
+        cache_time = time.perf_counter() - start
+        print(f'{name}: без кэша {plain_time:.3f} с; '
+              f'с кэшем {cache_time:.3f} с '
+              f'({plain_time / cache_time:.1f}x); '
+              f'попаданий {cache.stats.hit_rate:.0%}; '
+              f'сэкономлено расчётов {cache.stats.hits}; '
+              f'память {cache.bytes / 2**20:.1f} МиБ')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Повторная обработка дня: списки + read_package против mmap-файла."""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_batch import make_packages
+from columnar import ColumnarFile, write_packages
+from homework import read_package
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=200_000)
+    args = parser.parse_args()
+    packages = [(workout_type, data)
+                for workout_type, items in make_packages(args.count).items()
+                for data in items]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'day.ftrk')
+        start = time.perf_counter()
+        write_packages(path, packages)
+        print(f'запись файла:      {time.perf_counter() - start:.3f} с; '
+              f'{os.path.getsize(path) / 2**20:.1f} МиБ')
+
+        start = time.perf_counter()
+        for workout_type, data in packages:
+            read_package(workout_type, data).get_spent_calories()
+        objects_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ColumnarFile(path) as file:
+            results = file.compute()
+        mmap_time = time.perf_counter() - start
+        rows = sum(len(result['calories']) for result in results.values())
+        assert rows == len(packages)
+        print(f'read_package:      {objects_time:.3f} с')
+        print(f'mmap + пакетно:    {mmap_time:.3f} с '
+              f'({objects_time / mmap_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
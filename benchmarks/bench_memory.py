@@ -0,0 +1,50 @@
+"""Память на хранение тренировок: объекты против столбцов."""
+import argparse
+import tracemalloc
+from typing import Callable
+
+from batch import TrainingArray
+from benchmarks.bench_batch import make_packages
+from homework import InfoMessage, Running
+
+
+class DictInfoMessage(InfoMessage):
+    """Сообщение с `__dict__`, как до введения `__slots__`."""
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Вернуть объём памяти, занятый результатом `build()`."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=200_000)
+    args = parser.parse_args()
+    packages = make_packages(args.count)['RUN']
+    infos = TrainingArray('RUN', packages).show_training_info()
+    cases = {
+        'Running, объекты': lambda: [Running(*data) for data in packages],
+        'TrainingArray': lambda: TrainingArray('RUN', packages),
+        'InfoMessage с __dict__': lambda: [
+            DictInfoMessage(info.training_type, info.duration,
+                            info.distance, info.speed, info.calories)
+            for info in infos],
+        'InfoMessage с __slots__': lambda: [
+            InfoMessage(info.training_type, info.duration,
+                        info.distance, info.speed, info.calories)
+            for info in infos],
+    }
+    for name, build in cases.items():
+        size = measure(build)
+        print(f'{name:24s} {size / 2**20:8.1f} МиБ '
+              f'{size / args.count:6.1f} байт/запись')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Вызовы и время на тренировку: повторные расчёты против `get_metrics`."""
+import argparse
+import cProfile
+import pstats
+import time
+from typing import Callable, List
+
+from benchmarks.bench_batch import make_packages
+from homework import InfoMessage, Training, TrainingMetrics, read_package
+
+
+def training_info(training: Training) -> InfoMessage:
+    return training.show_training_info()
+
+
+def repeated_metrics(training: Training) -> TrainingMetrics:
+    """Три обращения к показателям, как у потребителей результатов."""
+    training.get_metrics()
+    training.get_metrics()
+    return training.get_metrics()
+
+
+def repeated_training_info(training: Training) -> InfoMessage:
+    """Те же три обращения без запоминания."""
+    training.show_training_info()
+    training.show_training_info()
+    return training.show_training_info()
+
+
+def count_calls(show: Callable[[Training], object],
+                trainings: List[Training]) -> int:
+    """Количество вызовов методов расчёта на одну тренировку."""
+    profile = cProfile.Profile()
+    profile.runcall(lambda: [show(training) for training in trainings])
+    stats = pstats.Stats(profile).stats
+    names = ('get_distance', 'get_mean_speed', 'get_spent_calories')
+    calls = sum(values[1] for (_, _, name), values in stats.items()
+                if name in names)
+    return calls // len(trainings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=100_000)
+    args = parser.parse_args()
+    trainings = [read_package(workout_type, data)
+                 for workout_type, items in make_packages(args.count).items()
+                 for data in items]
+    cases = {'show_training_info': training_info,
+             'show_training_info x3': repeated_training_info,
+             'get_metrics x3': repeated_metrics}
+    for name, show in cases.items():
+        calls = count_calls(show, trainings[::max(1, len(trainings) // 3000)])
+        for training in trainings:
+            training.__dict__.pop('_metrics', None)
+        start = time.perf_counter()
+        for training in trainings:
+            show(training)
+        elapsed = time.perf_counter() - start
+        print(f'{name:22s} вызовов на тренировку: {calls}; '
+              f'{elapsed / len(trainings) * 1e9:.0f} нс на тренировку')
+
+
+if __name__ == '__main__':
+    main()
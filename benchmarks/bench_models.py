@@ -0,0 +1,39 @@
+"""Сравнение моделей калорий: объекты против одного пакетного прохода."""
+import argparse
+import time
+
+from benchmarks.bench_batch import make_packages
+from models import MODELS, compare_models, register_model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=100_000)
+    args = parser.parse_args()
+    packages = [(workout_type, data)
+                for workout_type, items in make_packages(args.count).items()
+                for data in items]
+    register_model('bench', {'RUN': {'RUN_SPEED_COEFF1': 17.5},
+                             'WLK': {'WALK_WEIGHT_COEF1': 0.04},
+                             'SWM': {'ADD_SPEED': 1.2}})
+    names = ['default', 'bench']
+
+    for name in names:
+        model = MODELS[name]
+        start = time.perf_counter()
+        for workout_type, data in packages:
+            model.read_package(workout_type, data).get_spent_calories()
+        print(f'объекты, {name:8s} {time.perf_counter() - start:.3f} с')
+
+    start = time.perf_counter()
+    results = compare_models(packages, names)
+    seconds = time.perf_counter() - start
+    for name in names:
+        total = sum(sum(result['calories'])
+                    for result in results[name].values())
+        print(f'модель {name:8s} {total:,.0f} ккал')
+    print(f'пакетно, обе модели: {seconds:.3f} с')
+
+
+if __name__ == '__main__':
+    main()
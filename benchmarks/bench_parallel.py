@@ -0,0 +1,33 @@
+"""Масштабирование параллельной обработки по числу процессов."""
+import argparse
+import os
+import time
+
+from benchmarks.bench_batch import make_packages
+from parallel import process_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=200_000,
+                        help='количество пакетов каждого типа')
+    parser.add_argument('-c', '--chunk-size', type=int, default=5_000)
+    args = parser.parse_args()
+    packages = [(workout_type, data)
+                for workout_type, items in make_packages(args.count).items()
+                for data in items]
+    workers = 1
+    baseline = None
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        process_parallel(packages, workers, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f'процессов: {workers:2d}; {elapsed:.3f} с; '
+              f'{len(packages) / elapsed:,.0f} пакетов/с; '
+              f'ускорение {baseline / elapsed:.1f}x')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Разбор пакетов: словарь в каждом вызове против реестра."""
+import argparse
+import random
+import time
+from dataclasses import fields
+from typing import Dict, Type
+
+from benchmarks.bench_batch import make_packages
+from homework import Running, SportsWalking, Swimming, Training, read_package
+
+
+def legacy_read_package(workout_type: str, data: list) -> Training:
+    """Прежний `read_package`."""
+    help_read_package: Dict[str, Type[Training]] = {
+        'SWM': Swimming,
+        'RUN': Running,
+        'WLK': SportsWalking
+    }
+    if workout_type not in help_read_package:
+        raise ValueError(workout_type)
+    if len(data) != len(fields(help_read_package[workout_type])):
+        raise TypeError(workout_type)
+    return help_read_package[workout_type](*data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=200_000)
+    args = parser.parse_args()
+    packages = [(workout_type, data)
+                for workout_type, items in make_packages(args.count).items()
+                for data in items]
+    random.Random(0).shuffle(packages)
+    for name, read in [('прежний', legacy_read_package),
+                       ('реестр', read_package)]:
+        start = time.perf_counter()
+        for workout_type, data in packages:
+            read(workout_type, data)
+        elapsed = time.perf_counter() - start
+        print(f'{name:8s} {elapsed:.3f} с; '
+              f'{len(packages) / elapsed:,.0f} пакетов/с')
+
+
+if __name__ == '__main__':
+    main()
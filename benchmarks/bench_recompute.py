@@ -0,0 +1,44 @@
+"""Исправление истории: пересчёт всего против пересчёта затронутого."""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_store import make_records
+from recompute import RecomputeEngine, rebuild_aggregator
+from store import TrainingStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=300_000)
+    parser.add_argument('--users', type=int, default=1_000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        with TrainingStore(os.path.join(directory, 'trainings.db')) as store:
+            store.add_many(make_records(args.count, args.users))
+            engine = RecomputeEngine(store,
+                                     aggregator=rebuild_aggregator(store))
+
+            start = time.perf_counter()
+            everything = engine.recompute(store.query())
+            rebuild_aggregator(store)
+            full = time.perf_counter() - start
+            print(f'всё заново:       {full:.2f} с '
+                  f'({everything.rows:,d} строк)')
+
+            start = time.perf_counter()
+            change = engine.set_user_field('user1', 'weight', 77.5)
+            seconds = time.perf_counter() - start
+            print(f'вес пользователя: {seconds * 1e3:.1f} мс '
+                  f'({change.rows:,d} строк, {full / seconds:.0f}x)')
+
+            start = time.perf_counter()
+            change = engine.set_constants({'SWM': {'ADD_SPEED': 1.2}})
+            seconds = time.perf_counter() - start
+            print(f'ADD_SPEED:        {seconds:.2f} с '
+                  f'({change.rows:,d} строк, {full / seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
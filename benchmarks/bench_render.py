@@ -0,0 +1,54 @@
+"""Отрисовка сообщений: `asdict` + `str.format` против скомпилированной."""
+import argparse
+import io
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict
+
+from batch import TrainingArray
+from benchmarks.bench_batch import make_packages
+from homework import InfoMessage, write_messages
+
+
+def legacy_message(message: InfoMessage) -> str:
+    """Прежний `get_message`."""
+    return message.MESSAGE.format(**asdict(message))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=100_000)
+    args = parser.parse_args()
+    messages = [message
+                for workout_type, items in make_packages(args.count).items()
+                for message in TrainingArray(workout_type,
+                                             items).show_training_info()]
+
+    def print_legacy() -> None:
+        for message in messages:
+            print(legacy_message(message))
+
+    def print_current() -> None:
+        for message in messages:
+            print(message.get_message())
+
+    def bulk() -> None:
+        write_messages(messages)
+
+    outputs = {}
+    for name, render in [('asdict + print', print_legacy),
+                         ('get_message + print', print_current),
+                         ('write_messages', bulk)]:
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        with redirect_stdout(buffer):
+            render()
+        elapsed = time.perf_counter() - start
+        outputs[name] = buffer.getvalue()
+        print(f'{name:20s} {elapsed:.3f} с; '
+              f'{len(messages) / elapsed:,.0f} строк/с')
+    assert len(set(outputs.values())) == 1, 'Текст сообщений различается'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Запись отчётов: построчный `print` против файлов по разделам."""
+import argparse
+import contextlib
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_batch import make_packages
+from homework import main as print_report
+from homework import read_package
+from reports import ShardedReportWriter, write_reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=100_000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('-w', '--workers', type=int,
+                        default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    records = [(f'user{rnd.randrange(args.users)}', workout_type, data)
+               for workout_type, items in make_packages(args.count).items()
+               for data in items]
+    rnd.shuffle(records)
+    trainings = [(shard, read_package(workout_type, data))
+                 for shard, workout_type, data in records]
+
+    def rate(seconds: float) -> str:
+        return f'{seconds:.3f} с, {len(records) / seconds:,.0f} строк/с'
+
+    with tempfile.TemporaryDirectory() as directory:
+        timings = {}
+        for buffering, label in ((-1, 'print в файл:'),
+                                 (1, 'print, сброс строк:')):
+            start = time.perf_counter()
+            with open(os.path.join(directory, 'print.txt'), 'w',
+                      buffering=buffering, encoding='utf-8') as file:
+                with contextlib.redirect_stdout(file):
+                    for _, training in trainings:
+                        print_report(training)
+            timings[buffering] = time.perf_counter() - start
+            print(f'{label:26s}{rate(timings[buffering])}')
+        baseline = timings[1]
+
+        for compress in (False, True):
+            target = os.path.join(directory, f'shards{compress:d}')
+            start = time.perf_counter()
+            with ShardedReportWriter(target, compress=compress) as writer:
+                for shard, training in trainings:
+                    writer.write(shard, training.show_training_info())
+            seconds = time.perf_counter() - start
+            label = 'разделы + gzip:' if compress else 'разделы:'
+            print(f'{label:26s}{rate(seconds)} '
+                  f'({baseline / seconds:.1f}x)')
+
+        start = time.perf_counter()
+        write_reports(records, os.path.join(directory, 'parallel'),
+                      args.workers)
+        seconds = time.perf_counter() - start
+        print(f'разделы, {args.workers} процесс(а): '
+              f'{rate(seconds)} ({baseline / seconds:.1f}x, с расчётом)')
+
+
+if __name__ == '__main__':
+    main()
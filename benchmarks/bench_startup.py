@@ -0,0 +1,77 @@
+"""Время запуска для коротких вызовов и работа тёплого процесса.
+
+Сравнивает `python cli.py` с `python streaming.py` на маленькой партии,
+выводит суммарное время импорта по `python -X importtime` и время
+ответа тёплого процесса `python cli.py --worker` на партию.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+BATCH = 'SWM,720,1,80,25,40\nRUN,15000,1,75\nWLK,9000,1,75,180\n'
+STARTUP_BUDGET_MS: float = 50.0  # цель: запуск `cli.py` сверх пустого python
+
+
+def import_time_ms(module: str) -> float:
+    """Суммарное время импорта модуля по `-X importtime`, мс."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f'Нет данных об импорте {module}')
+
+
+def run_ms(command: List[str], runs: int) -> float:
+    """Медианное время запуска команды на партии, мс."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=BASE_DIR, input=BATCH, text=True,
+                       capture_output=True, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def worker_ms(batches: int) -> float:
+    """Среднее время ответа тёплого процесса на партию, мс."""
+    worker = subprocess.Popen([sys.executable, 'cli.py', '--worker'],
+                              cwd=BASE_DIR, stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, text=True)
+    start = time.perf_counter()
+    for _ in range(batches):
+        worker.stdin.write(BATCH + '\n')
+        worker.stdin.flush()
+        while worker.stdout.readline().strip():
+            pass
+    elapsed = time.perf_counter() - start
+    worker.stdin.close()
+    worker.wait()
+    return elapsed / batches * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-r', '--runs', type=int, default=20)
+    args = parser.parse_args()
+    for module in ('cli', 'homework', 'streaming'):
+        print(f'импорт {module:10s} {import_time_ms(module):7.1f} мс')
+    empty = run_ms([sys.executable, '-c', 'pass'], args.runs)
+    cli = run_ms([sys.executable, 'cli.py'], args.runs)
+    streaming = run_ms([sys.executable, 'streaming.py'], args.runs)
+    print(f'пустой python      {empty:7.1f} мс')
+    print(f'cli.py             {cli:7.1f} мс '
+          f'(цель: не больше {STARTUP_BUDGET_MS} мс сверх пустого python)')
+    print(f'streaming.py       {streaming:7.1f} мс')
+    print(f'cli.py --worker    {worker_ms(args.runs * 10):7.2f} мс на партию')
+    return 0 if cli - empty <= STARTUP_BUDGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Лидеры и квантили: потоковая статистика против полной сортировки."""
+import argparse
+import random
+import time
+
+from batch import TrainingArray
+from benchmarks.bench_batch import make_packages
+from benchmarks.bench_memory import measure
+from stats import QUANTILES, TrainingStats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=300_000)
+    parser.add_argument('--users', type=int, default=100_000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    # активность пользователей неравномерна: немногие тренируются часто
+    results = [(f'user{int(args.users * rnd.random()**3)}', info)
+               for workout_type, items in make_packages(args.count).items()
+               for info in TrainingArray(workout_type,
+                                         items).show_training_info()]
+
+    start = time.perf_counter()
+    collected = TrainingStats()
+    collected.add_many(results)
+    seconds = time.perf_counter() - start
+
+    def build() -> TrainingStats:
+        built = TrainingStats()
+        built.add_many(results)
+        return built
+
+    size = measure(build)
+    print(f'потоково: {seconds:.3f} с, '
+          f'{len(results) / seconds:,.0f} результатов/с')
+
+    start = time.perf_counter()
+    speeds = {}
+    for _, info in results:
+        speeds.setdefault(info.training_type, []).append(info.speed)
+    for values in speeds.values():
+        values.sort()
+    top = sorted(((info.calories, user) for user, info in results),
+                 reverse=True)[:len(collected.top())]
+    totals = {}
+    for user, info in results:
+        totals[user] = totals.get(user, 0) + max(info.calories, 0.0)
+    users = sorted(((total, user) for user, total in totals.items()),
+                   reverse=True)[:len(collected.top_users())]
+    print(f'сортировка: {time.perf_counter() - start:.3f} с')
+    assert top == collected.top()
+    found = {user for _, user in collected.top_users()}
+    print(f'лидеров-пользователей найдено: '
+          f'{len(found & {user for _, user in users})} из {len(users)}')
+
+    for training_type, values in sorted(speeds.items()):
+        estimates = collected.quantiles(training_type)
+        errors = []
+        for q in QUANTILES:
+            exact = values[int(q * (len(values) - 1))]
+            errors.append(abs(estimates[q] - exact) / exact)
+        print(f'{training_type:14s} наибольшая ошибка квантиля '
+              f'{max(errors):.2%}')
+    buckets = sum(len(sketch.buckets)
+                  for sketch in collected.sketches.values())
+    print(f'корзин в скетчах: {buckets}; память статистики после '
+          f'добавления: {size / 2**10:.0f} КиБ')
+
+
+if __name__ == '__main__':
+    main()
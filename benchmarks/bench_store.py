@@ -0,0 +1,92 @@
+"""Хранилище SQLite: скорость записи пачками и задержка выборок."""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Iterator
+
+from store import Record, TrainingStore
+
+START = date(2024, 1, 1)
+
+
+def make_records(count: int, users: int, seed: int = 0) -> Iterator[Record]:
+    """Случайные пакеты пользователей за год."""
+    rnd = random.Random(seed)
+    for _ in range(count):
+        user = f'user{rnd.randrange(users)}'
+        day = START + timedelta(days=rnd.randrange(365))
+        workout_type = rnd.choice(('RUN', 'WLK', 'SWM'))
+        data = [rnd.randint(1000, 20000), rnd.uniform(0.5, 2),
+                rnd.uniform(50, 100)]
+        if workout_type == 'WLK':
+            data.append(rnd.uniform(150, 200))
+        elif workout_type == 'SWM':
+            data += [25, rnd.randint(10, 60)]
+        yield user, day, workout_type, data
+
+
+def latency(run, repeat: int = 200) -> float:
+    """Медиана времени вызова, мс."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=1_000_000,
+                        help='число строк, например 10000000')
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--path', help='файл базы; по умолчанию временный')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.path or os.path.join(directory, 'trainings.db')
+        naive = sqlite3.connect(os.path.join(directory, 'naive.db'))
+        naive.execute('CREATE TABLE t (user TEXT, day TEXT, '
+                      'workout_type TEXT, data TEXT)')
+        start = time.perf_counter()
+        for user, day, workout_type, data in make_records(2_000,
+                                                          args.users):
+            with naive:
+                naive.execute('INSERT INTO t VALUES (?, ?, ?, ?)',
+                              (user, day.isoformat(), workout_type,
+                               repr(data)))
+        naive_rate = 2_000 / (time.perf_counter() - start)
+        print(f'по строке на транзакцию: {naive_rate:,.0f} строк/с')
+
+        with TrainingStore(path) as store:
+            start = time.perf_counter()
+            count = store.add_many(make_records(args.count, args.users))
+            seconds = time.perf_counter() - start
+            print(f'пачками, WAL:            {count / seconds:,.0f} строк/с '
+                  f'({count:,d} строк, {seconds:.1f} с, '
+                  f'{os.path.getsize(path) / 2**20:.0f} МиБ)')
+
+            rnd = random.Random(1)
+
+            def history() -> None:
+                store.history(f'user{rnd.randrange(args.users)}')
+
+            def month() -> None:
+                day = START + timedelta(days=rnd.randrange(330))
+                store.history(f'user{rnd.randrange(args.users)}', day,
+                              day + timedelta(days=30), 'RUN')
+
+            def day_totals() -> None:
+                store.day_totals(START + timedelta(days=rnd.randrange(365)))
+
+            print(f'история пользователя:    {latency(history):.2f} мс')
+            print(f'месяц бега пользователя: {latency(month):.2f} мс')
+            print(f'итоги дня:               {latency(day_totals, 20):.2f} мс')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Многочасовая тренировка по отсчётам: списки кортежей против каналов."""
+import argparse
+import random
+import time
+from array import array
+
+from benchmarks.bench_memory import measure
+from timeseries import WorkoutSeries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--hours', type=float, default=6)
+    parser.add_argument('--rate', type=float, default=10,
+                        help='частота отсчётов, Гц')
+    args = parser.parse_args()
+    count = int(args.hours * 3600 * args.rate)
+    rnd = random.Random(0)
+    steps = array('d', (rnd.randint(0, 3) for _ in range(count)))
+    interval = 1 / args.rate
+
+    size = measure(lambda: [(interval, value) for value in steps])
+    print(f'список кортежей:   {size / 2**20:7.1f} МиБ')
+
+    def load() -> WorkoutSeries:
+        series = WorkoutSeries('RUN', interval, weight=75)
+        series.extend_channels(action=steps)
+        return series
+
+    size = measure(load)
+    start = time.perf_counter()
+    series = load()
+    print(f'каналы array:      {size / 2**20:7.1f} МиБ; загрузка '
+          f'{time.perf_counter() - start:.4f} с ({count:,d} отсчётов)')
+
+    start = time.perf_counter()
+    for value in steps[:100_000]:
+        series.append(value)
+    print(f'append:            '
+          f'{(time.perf_counter() - start) / 100_000 * 1e9:.0f} нс/отсчёт')
+
+    start = time.perf_counter()
+    series.show_training_info()
+    print(f'итог тренировки:   '
+          f'{(time.perf_counter() - start) * 1e6:.1f} мкс')
+    start = time.perf_counter()
+    splits = series.splits(1000)
+    print(f'отрезки по 1000 с: {time.perf_counter() - start:.4f} с '
+          f'({len(splits)} шт.)')
+    start = time.perf_counter()
+    coarse = series.downsample(int(args.rate))
+    print(f'прореживание до 1 Гц: {time.perf_counter() - start:.4f} с '
+          f'({len(coarse):,d} отсчётов)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Шумные данные: исключение на каждый плохой пакет против проверки набора."""
+import argparse
+import random
+import time
+
+from benchmarks.bench_batch import make_packages
+from homework import read_package
+from validation import validate_batch
+
+BROKEN = [('BIK', [1, 2, 3]), ('RUN', [15000, 1]), ('RUN', [15000, 0, 75]),
+          ('WLK', [9000, 1, 75, 0])]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--count', type=int, default=100_000)
+    parser.add_argument('-b', '--broken', type=float, default=0.3,
+                        help='доля плохих пакетов')
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    packages = [(workout_type, data)
+                for workout_type, items in make_packages(args.count).items()
+                for data in items]
+    packages = [rnd.choice(BROKEN) if rnd.random() < args.broken else package
+                for package in packages]
+
+    start = time.perf_counter()
+    infos, errors = [], []
+    for workout_type, data in packages:
+        try:
+            infos.append(read_package(workout_type, data)
+                         .show_training_info())
+        except (ValueError, TypeError, ZeroDivisionError) as err:
+            errors.append(err)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = validate_batch(packages)
+    checked = result.show_training_info()
+    batch_time = time.perf_counter() - start
+
+    assert checked == infos
+    print(f'пакетов: {len(packages)}; плохих: {len(errors)}')
+    print(f'try/except:     {loop_time:.3f} с')
+    print(f'validate_batch: {batch_time:.3f} с '
+          f'({loop_time / batch_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Нагрузочный клиент для `server.py`: задержки и пропускная способность."""
+import argparse
+import asyncio
+import json
+import time
+from typing import List, Optional
+
+from server import TrainingServer
+
+REQUEST = {'workout_type': 'RUN', 'data': [15000, 1, 75]}
+
+
+async def client(host: str, port: int, requests: int, window: int,
+                 latencies: List[float]) -> None:
+    """Отправлять запросы окном `window` и замерять время ответа."""
+    reader, writer = await asyncio.open_connection(host, port)
+    sent = {}
+    window_slots = asyncio.Semaphore(window)
+
+    async def send() -> None:
+        for request_id in range(requests):
+            await window_slots.acquire()
+            sent[request_id] = time.perf_counter()
+            writer.write(json.dumps({'id': request_id, **REQUEST}).encode()
+                         + b'\n')
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in range(requests):
+        reply = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent.pop(reply['id']))
+        window_slots.release()
+    await sender
+    writer.close()
+
+
+def percentile(values: List[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+async def run(connections: int, requests: int, window: int,
+              port: Optional[int]) -> None:
+    training_server = None
+    if port is None:
+        training_server = TrainingServer()
+        await training_server.start()
+        port = training_server.port
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client('127.0.0.1', port, requests, window,
+                                  latencies)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    if training_server is not None:
+        await training_server.close()
+    print(f'запросов: {len(latencies)}; {elapsed:.2f} с; '
+          f'{len(latencies) / elapsed:,.0f} запросов/с')
+    print(f'p50: {percentile(latencies, 0.50) * 1000:.2f} мс; '
+          f'p99: {percentile(latencies, 0.99) * 1000:.2f} мс')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-c', '--connections', type=int, default=16)
+    parser.add_argument('-n', '--requests', type=int, default=2_000,
+                        help='запросов на соединение')
+    parser.add_argument('-w', '--window', type=int, default=32,
+                        help='запросов без ответа на соединение')
+    parser.add_argument('-p', '--port', type=int,
+                        help='порт внешнего сервера; по умолчанию '
+                             'сервер запускается в этом процессе')
+    args = parser.parse_args()
+    asyncio.run(run(args.connections, args.requests, args.window,
+                    args.port))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Набор бенчмарков расчёта тренировок с проверкой регрессий.
+
+Каждый сценарий выполняется `size` раз на наборе из не более чем
+`POOL_SIZE` разных входов, поэтому масштаб 10M не требует держать
+10M объектов в памяти. Результаты сохраняются в JSON и сравниваются
+с сохранённой базой.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.bench_batch import make_packages
+from homework import read_package
+
+POOL_SIZE: int = 10_000
+THRESHOLD: float = 0.10
+
+Case = Tuple[Callable[[object], object], Sequence[object]]
+
+
+def build_cases() -> Dict[str, Case]:
+    """Сценарии: функция и набор входов для неё."""
+    packages = make_packages(POOL_SIZE // 3)
+    mixed = [(workout_type, data)
+             for workout_type, items in packages.items()
+             for data in items]
+    random.Random(0).shuffle(mixed)
+    trainings = {workout_type: [read_package(workout_type, data)
+                                for data in items]
+                 for workout_type, items in packages.items()}
+    all_trainings = [training for items in trainings.values()
+                     for training in items]
+    messages = [training.show_training_info() for training in all_trainings]
+    return {
+        'read_package': (lambda package: read_package(*package), mixed),
+        'Running.get_spent_calories': (
+            lambda training: training.get_spent_calories(),
+            trainings['RUN']),
+        'SportsWalking.get_spent_calories': (
+            lambda training: training.get_spent_calories(),
+            trainings['WLK']),
+        'Swimming.get_spent_calories': (
+            lambda training: training.get_spent_calories(),
+            trainings['SWM']),
+        'show_training_info': (
+            lambda training: training.show_training_info(), all_trainings),
+        'InfoMessage.get_message': (
+            lambda message: message.get_message(), messages),
+    }
+
+
+def run_case(case: Case, size: int, repeat: int) -> float:
+    """Лучшее время `size` вызовов из `repeat` попыток."""
+    function, pool = case
+    full, rest = divmod(size, len(pool))
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(full):
+            for item in pool:
+                function(item)
+        for item in pool[:rest]:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(sizes: Sequence[int], repeat: int,
+              only: Sequence[str] = ()) -> dict:
+    """Выполнить сценарии и вернуть результаты для JSON."""
+    results = {}
+    for name, case in build_cases().items():
+        if only and name not in only:
+            continue
+        for size in sizes:
+            seconds = run_case(case, size, repeat)
+            results[f'{name}@{size}'] = {
+                'seconds': seconds,
+                'ns_per_op': seconds / size * 1e9
+            }
+            print(f'{name:34s} {size:>10,d} '
+                  f'{seconds / size * 1e9:10.1f} нс/оп', flush=True)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+
+
+def find_regressions(current: dict, baseline: dict,
+                     threshold: float = THRESHOLD) -> List[str]:
+    """Сценарии, ставшие медленнее базы больше чем на `threshold`."""
+    regressions = []
+    for key, result in current['results'].items():
+        if key not in baseline['results']:
+            continue
+        before = baseline['results'][key]['ns_per_op']
+        after = result['ns_per_op']
+        if after > before * (1 + threshold):
+            regressions.append(f'{key}: {before:.1f} -> {after:.1f} нс/оп '
+                               f'(+{(after / before - 1) * 100:.0f}%)')
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='1000,1000000',
+                        help='масштабы через запятую, например '
+                             '1000,1000000,10000000')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', action='append', default=[],
+                        help='выполнить только указанный сценарий')
+    parser.add_argument('--save', help='сохранить результаты в JSON')
+    parser.add_argument('--baseline', help='JSON с базовыми результатами')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='допустимое замедление, доля')
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    current = run_suite(sizes, args.repeat, args.only)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(current, file, ensure_ascii=False, indent=2)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+    regressions = find_regressions(current, baseline, args.threshold)
+    for regression in regressions:
+        print(f'РЕГРЕССИЯ {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""LRU-кэш результатов для повторяющихся пакетов датчиков."""
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+from homework import InfoMessage, read_package
+
+MAX_ENTRIES: int = 100_000
+MAX_BYTES: int = 64 * 2**20
+ENTRY_OVERHEAD: int = 100  # узел OrderedDict и запись в хэш-таблице
+
+Key = Tuple[str, Tuple[float, ...]]
+
+
+@dataclass
+class CacheStats:
+    """Статистика обращений к кэшу."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля обращений, обслуженных из кэша."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def normalize(workout_type: str, data: Sequence[float]) -> Key:
+    """Привести пакет к ключу кэша.
+
+    Равные `int` и `float` имеют одинаковый хэш, поэтому `[15000, 1, 75]`
+    и `[15000.0, 1.0, 75.0]` дают один ключ без преобразования значений.
+    """
+    return workout_type, tuple(data)
+
+
+def entry_size(key: Key, info: InfoMessage) -> int:
+    """Примерный объём памяти записи кэша в байтах.
+
+    Оценка зависит только от числа значений в пакете и запоминается.
+    """
+    arity = len(key[1])
+    if arity not in _ENTRY_SIZES:
+        float_size = sys.getsizeof(0.0)
+        _ENTRY_SIZES[arity] = (sys.getsizeof(key)
+                               + sys.getsizeof(key[1])
+                               + arity * float_size
+                               + sys.getsizeof(info) + 4 * float_size
+                               + ENTRY_OVERHEAD)
+    return _ENTRY_SIZES[arity]
+
+
+_ENTRY_SIZES: Dict[int, int] = {}
+
+
+class PackageCache:
+    """Кэш `read_package` + `show_training_info` с вытеснением LRU.
+
+    Размер ограничен числом записей и оценкой занятой памяти. Пакеты с
+    ошибками не кэшируются, исключения передаются вызывающему коду.
+    Возвращаемые `InfoMessage` общие для повторов, их нельзя изменять.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES,
+                 max_bytes: int = MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[Key, list]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, workout_type: str, data: Sequence[float]) -> list:
+        """Запись `[InfoMessage, текст или None, размер]` для пакета."""
+        try:
+            key = normalize(workout_type, data)
+            entry = self._entries.get(key)
+        except TypeError:
+            key = entry = None
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+        self.stats.misses += 1
+        info = read_package(workout_type, data).show_training_info()
+        entry = [info, None, 0]
+        if key is not None:
+            self._store(key, entry)
+        return entry
+
+    def get_info(self, workout_type: str,
+                 data: Sequence[float]) -> InfoMessage:
+        """Вернуть сообщение о тренировке, рассчитав его при промахе."""
+        return self._entry(workout_type, data)[0]
+
+    def get_message(self, workout_type: str, data: Sequence[float]) -> str:
+        """Вернуть текст сообщения, отрисовав его один раз на запись."""
+        entry = self._entry(workout_type, data)
+        if entry[1] is None:
+            entry[1] = entry[0].get_message()
+            if entry[2]:
+                size = sys.getsizeof(entry[1])
+                entry[2] += size
+                self.bytes += size
+                self._evict()
+        return entry[1]
+
+    def _store(self, key: Key, entry: list) -> None:
+        size = entry_size(key, entry[0])
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        entry[2] = size
+        self._entries[key] = entry
+        self.bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while (len(self._entries) > self.max_entries
+               or self.bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self.bytes -= entry[2]
+            entry[2] = 0
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Очистить кэш, сохранив статистику."""
+        self._entries.clear()
+        self.bytes = 0
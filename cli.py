@@ -0,0 +1,80 @@
+"""Лёгкий запуск расчёта для небольших пакетов из stdin.
+
+При запуске импортируются только `sys` и `typing`: расчётный модуль
+`homework` загружается, когда приходит первый пакет, а `argparse`,
+`json`, `asyncio` и пакетные модули не загружаются вовсе. Пакеты -
+строки вида `RUN,15000,1,75`.
+
+В режиме `--worker` процесс не завершается после пакета: партии
+разделяются пустой строкой, ответ на каждую партию тоже заканчивается
+пустой строкой. Так один процесс обслуживает сколько угодно запусков.
+"""
+import sys
+from typing import Iterable, List, Optional, TextIO
+
+USAGE = 'Использование: python cli.py [--worker] < пакеты.csv'
+
+
+def process_lines(lines: Iterable[str], output: TextIO) -> int:
+    """Рассчитать пакеты и записать сообщения; вернуть число ошибок.
+
+    Пустые строки пропускаются, но учитываются в номерах строк.
+    """
+    import homework
+
+    results = []
+    errors = 0
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        workout_type, *values = line.split(',')
+        try:
+            data = [float(value) for value in values]
+        except ValueError as err:
+            errors += 1
+            results.append(f'Строка {line_no}: не удалось разобрать пакет '
+                           f'({err!r})')
+            continue
+        try:
+            info = homework.read_package(workout_type, data)
+            results.append(info.show_training_info().get_message())
+        except (ValueError, TypeError, ArithmeticError) as err:
+            errors += 1
+            results.append(homework.error_message(err))
+    results.append('')
+    output.write('\n'.join(results))
+    return errors
+
+
+def run_worker(source: Iterable[str], output: TextIO) -> None:
+    """Обрабатывать партии, разделённые пустой строкой, до конца ввода."""
+    batch = []
+    for line in source:
+        if line.strip():
+            batch.append(line)
+            continue
+        if batch:
+            process_lines(batch, output)
+            batch = []
+        output.write('\n')
+        output.flush()
+    if batch:
+        process_lines(batch, output)
+        output.write('\n')
+        output.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv == ['--worker']:
+        run_worker(sys.stdin, sys.stdout)
+        return 0
+    if argv:
+        print(USAGE, file=sys.stderr)
+        return 2
+    return 1 if process_lines(sys.stdin, sys.stdout) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""Двоичный столбцовый формат разобранных тренировок.
+
+Файл начинается с заголовка `FTRK`, за ним идут секции по типам
+тренировок. Секция хранит код типа, число полей и число записей, затем
+столбцы float64 (little-endian) в порядке полей класса тренировки.
+Все смещения выровнены по 8 байтам, поэтому столбцы читаются через
+`mmap` без копирования.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from batch import (Columns, Results, TrainingArray, check_columns,
+                   compute_batch, results_to_info)
+from homework import WORKOUT_TYPES, InfoMessage
+
+MAGIC: bytes = b'FTRK'
+VERSION: int = 1
+FILE_HEADER = struct.Struct('<4sHH')
+SECTION_HEADER = struct.Struct('<4sHxxQ')
+ITEM_SIZE: int = 8
+CODE_SIZE: int = 4  # байт на код типа в заголовке секции
+
+
+def _column_bytes(column: Iterable[float]) -> array:
+    """Столбец как `array('d')` в порядке байтов little-endian."""
+    values = column if isinstance(column, array) else array('d', column)
+    if sys.byteorder != 'little':
+        values = array('d', values)
+        values.byteswap()
+    return values
+
+
+def _section_code(workout_type: str) -> bytes:
+    """Код типа для заголовка секции: ASCII не длиннее `CODE_SIZE`."""
+    if workout_type not in WORKOUT_TYPES:
+        raise ValueError(workout_type)
+    try:
+        code = workout_type.encode('ascii')
+    except UnicodeEncodeError:
+        code = b''
+    if not code or len(code) > CODE_SIZE or b'\0' in code:
+        raise ValueError(f'Код типа {workout_type!r} нельзя записать в '
+                         f'файл: нужно от 1 до {CODE_SIZE} символов '
+                         f'ASCII.')
+    return code
+
+
+def write_columns(path: str, sections: Mapping[str, Columns]) -> None:
+    """Записать столбцы тренировок, сгруппированные по типу.
+
+    Коды типов проверяются до открытия файла, поэтому неподходящий код
+    не оставляет на диске недописанный файл.
+    """
+    codes = {workout_type: _section_code(workout_type)
+             for workout_type in sections}
+    with open(path, 'wb') as file:
+        file.write(FILE_HEADER.pack(MAGIC, VERSION, len(sections)))
+        for workout_type, columns in sections.items():
+            training_class = WORKOUT_TYPES[workout_type]
+            rows = check_columns(training_class, columns)
+            names = TrainingArray(workout_type).names
+            file.write(SECTION_HEADER.pack(codes[workout_type],
+                                           len(names), rows))
+            for name in names:
+                _column_bytes(columns[name]).tofile(file)
+
+
+def write_packages(path: str,
+                   packages: Iterable[Tuple[str, List[float]]]) -> None:
+    """Сгруппировать пакеты по типу и записать их в файл."""
+    sections: Dict[str, TrainingArray] = {}
+    for workout_type, data in packages:
+        if workout_type not in sections:
+            sections[workout_type] = TrainingArray(workout_type)
+        sections[workout_type].append(data)
+    write_columns(path, {workout_type: trainings.columns
+                         for workout_type, trainings in sections.items()})
+
+
+class ColumnarFile:
+    """Файл тренировок, отображённый в память.
+
+    Столбцы доступны как `memoryview` поверх `mmap` и подходят для
+    `batch.compute_batch` без копирования данных.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.sections: Dict[str, Dict[str, memoryview]] = {}
+        self._file = open(path, 'rb')
+        self._mmap: Optional[mmap.mmap] = None
+        self._views: List[memoryview] = []
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            self._read_sections()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _read_sections(self) -> None:
+        magic, version, count = FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'Неизвестный формат файла: {magic!r} '
+                             f'версии {version}.')
+        buffer = memoryview(self._mmap)
+        self._views.append(buffer)
+        offset = FILE_HEADER.size
+        for _ in range(count):
+            code, field_count, rows = SECTION_HEADER.unpack_from(
+                self._mmap, offset)
+            workout_type = code.rstrip(b'\0').decode('ascii')
+            names = TrainingArray(workout_type).names
+            if field_count != len(names):
+                raise ValueError(f'В секции {workout_type} {field_count} '
+                                 f'полей вместо {len(names)}.')
+            offset += SECTION_HEADER.size
+            columns = {}
+            for name in names:
+                end = offset + rows * ITEM_SIZE
+                if end > len(self._mmap):
+                    raise ValueError(f'Секция {workout_type} обрезана.')
+                columns[name] = self._column(buffer[offset:end])
+                offset = end
+            self.sections[workout_type] = columns
+
+    def _column(self, raw: memoryview) -> memoryview:
+        """Столбец float64 без копирования на little-endian машинах."""
+        self._views.append(raw)
+        if sys.byteorder == 'little':
+            column = raw.cast('d')
+        else:
+            values = array('d', raw.tobytes())
+            values.byteswap()
+            column = memoryview(values)
+        self._views.append(column)
+        return column
+
+    def __enter__(self) -> 'ColumnarFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(columns['action'])
+                   for columns in self.sections.values())
+
+    def close(self) -> None:
+        """Освободить представления столбцов и закрыть файл."""
+        self.sections = {}
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def compute(self) -> Dict[str, Results]:
+        """Рассчитать показатели всех секций пакетно."""
+        return {workout_type: compute_batch(workout_type, columns)
+                for workout_type, columns in self.sections.items()}
+
+    def show_training_info(self) -> List[InfoMessage]:
+        """Вернуть информационные сообщения о всех тренировках."""
+        return [info
+                for workout_type, results in self.compute().items()
+                for info in results_to_info(WORKOUT_TYPES[workout_type],
+                                            results)]
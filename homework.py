@@ -1,12 +1,59 @@
+import re
+import sys
 from dataclasses import dataclass, asdict, fields
-
-from typing import Dict, Type, ClassVar
+from operator import attrgetter
+from string import Formatter
+
+from typing import (Callable, Dict, Iterable, NamedTuple, Optional, TextIO,
+                    Tuple, Type, ClassVar)
+
+# Спецификации, которые `%` и `str.format` понимают одинаково: знак,
+# `#`, `0`, ширина, точность и обязательный вещественный тип.
+PRINTF_SPEC = re.compile(r'[+ ]?#?0?\d*(\.\d+)?[eEfFgG]')
+
+
+def compile_message(template: str) -> Callable[['InfoMessage'], str]:
+    """Перевести шаблон `str.format` в шаблон `%` с порядком полей.
+
+    Если шаблон нельзя выразить через `%` или тип значения не подходит
+    к спецификации, используется `str.format` с его ошибками.
+    """
+    def format_message(message: 'InfoMessage') -> str:
+        return template.format(**asdict(message))
+
+    parts = []
+    names = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace('%', '%%'))
+        if name is None:
+            continue
+        if (conversion or not name.isidentifier()
+                or spec and not PRINTF_SPEC.fullmatch(spec)):
+            return format_message
+        names.append(name)
+        parts.append('%' + (spec or 's'))
+    printf = ''.join(parts)
+    if not names:
+        return lambda message: printf % ()
+    getter = attrgetter(*names)
+    single = len(names) == 1
+
+    def render(message: 'InfoMessage') -> str:
+        try:
+            if single:
+                return printf % (getter(message),)
+            return printf % getter(message)
+        except TypeError:
+            return format_message(message)
+    return render
 
 
 @dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
@@ -19,7 +66,40 @@ class InfoMessage:
                               'Потрачено ккал: {calories:.3f}.')
 
     def get_message(self) -> str:
-        return self.MESSAGE.format(**asdict(self))
+        if self.MESSAGE not in _RENDERERS:
+            _RENDERERS[self.MESSAGE] = compile_message(self.MESSAGE)
+        return _RENDERERS[self.MESSAGE](self)
+
+
+_RENDERERS: Dict[str, Callable[[InfoMessage], str]] = {}
+
+
+class TrainingMetrics(NamedTuple):
+    """Рассчитанные показатели тренировки."""
+
+    distance: float
+    speed: float
+    calories: float
+
+
+WORKOUT_TYPES: Dict[str, Type['Training']] = {}  # словарь описание: класс
+WORKOUT_ARITY: Dict[str, int] = {}  # словарь описание: число полей
+
+
+def register_workout(workout_type: str) -> Callable[[Type['Training']],
+                                                    Type['Training']]:
+    """Зарегистрировать класс тренировки под кодом пакета.
+
+    Декоратор ставится над `@dataclass`, чтобы поля класса были известны.
+    """
+    def register(training_class: Type['Training']) -> Type['Training']:
+        WORKOUT_TYPES[workout_type] = training_class
+        WORKOUT_ARITY[workout_type] = len(fields(training_class))
+        return training_class
+    return register
+
+
+_METRICS_KEYS: Dict[type, Callable[[object], Tuple[float, ...]]] = {}
 
 
 @dataclass
@@ -47,6 +127,30 @@ class Training:
         raise NotImplementedError(f'Не используем расчет калорий '
                                   f'для {self.__class__.__name__}')
 
+    def _metrics_key(self) -> Tuple[float, ...]:
+        """Значения полей, от которых зависят показатели."""
+        cls = self.__class__
+        if cls not in _METRICS_KEYS:
+            _METRICS_KEYS[cls] = attrgetter(*(field.name
+                                              for field in fields(cls)))
+        return _METRICS_KEYS[cls](self)
+
+    def get_metrics(self) -> TrainingMetrics:
+        """Рассчитать показатели и запомнить результат.
+
+        Повторные вызовы возвращают запомненные показатели, пока поля
+        тренировки не изменились.
+        """
+        key = self._metrics_key()
+        cached = self.__dict__.get('_metrics')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        metrics = TrainingMetrics(self.get_distance(),
+                                  self.get_mean_speed(),
+                                  self.get_spent_calories())
+        self._metrics = (key, metrics)
+        return metrics
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
         return InfoMessage(self.__class__.__name__,
@@ -57,6 +161,7 @@ class Training:
                            )
 
 
+@register_workout('RUN')
 @dataclass
 class Running(Training):
     """Тренировка: бег."""
@@ -71,6 +176,7 @@ class Running(Training):
                 * self.duration * self.MIN_IN_HOUR)
 
 
+@register_workout('WLK')
 @dataclass
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
@@ -89,6 +195,7 @@ class SportsWalking(Training):
                 * self.duration * self.MIN_IN_HOUR)
 
 
+@register_workout('SWM')
 @dataclass
 class Swimming(Training):
     """Тренировка: плавание."""
@@ -113,18 +220,33 @@ class Swimming(Training):
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    help_read_package: Dict[str, Type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }  # словарь описание: класс
-    if workout_type not in help_read_package:
+    if workout_type not in WORKOUT_TYPES:
         raise ValueError(workout_type)
-    if len(data) != len(fields(help_read_package[workout_type])):
+    if len(data) != WORKOUT_ARITY[workout_type]:
         raise TypeError(f'В данных тренировки {workout_type} передано '
                         f'неверное количество элементов: {len(data)} вместо '
-                        f'{len(fields(help_read_package[workout_type]))}.')
-    return help_read_package[workout_type](*data)
+                        f'{WORKOUT_ARITY[workout_type]}.')
+    return WORKOUT_TYPES[workout_type](*data)
+
+
+def error_message(error: Exception) -> str:
+    """Вернуть текст сообщения об ошибочном пакете."""
+    if isinstance(error, ValueError):
+        return f'Проверьте правильность типа тренировки {error}'
+    return str(error)
+
+
+def render_messages(messages: Iterable[InfoMessage]) -> str:
+    """Собрать текст сообщений, по одному на строку."""
+    lines = [message.get_message() for message in messages]
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def write_messages(messages: Iterable[InfoMessage],
+                   file: Optional[TextIO] = None) -> None:
+    """Записать сообщения в файл одной операцией записи."""
+    (file or sys.stdout).write(render_messages(messages))
 
 
 def main(training: Training) -> None:
@@ -142,7 +264,5 @@ if __name__ == '__main__':
     for workout_type, data in packages:
         try:
             main(read_package(workout_type, data))
-        except ValueError as err:
-            print(f'Проверьте правильность типа тренировки {err}')
-        except TypeError as err1:
-            print(err1)
+        except (ValueError, TypeError) as err:
+            print(error_message(err))
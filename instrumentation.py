@@ -0,0 +1,204 @@
+"""Включаемые по запросу счётчики и гистограммы этапов расчёта.
+
+Пока измерения выключены, код расчёта не меняется и не платит за них.
+`Instrumentation.enable()` подменяет `read_package` во всех загруженных
+модулях и методы расчёта калорий, `show_training_info` и `get_message`
+обёртками с замером времени, `disable()` возвращает исходные функции.
+"""
+import json
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Tuple
+
+import homework
+from homework import WORKOUT_TYPES, InfoMessage, Training
+
+BUCKETS: Tuple[float, ...] = (
+    1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1
+)  # верхние границы корзин гистограммы, с
+METRIC_NAME: str = 'fitness_stage_seconds'
+
+
+UNKNOWN_LABEL: str = 'unknown'
+
+
+def workout_label(workout_type: object) -> str:
+    """Метка типа тренировки; все незнакомые типы - одна метка.
+
+    Иначе мусорные типы от неисправного датчика создавали бы новую
+    гистограмму на каждое значение.
+    """
+    try:
+        known = workout_type in WORKOUT_TYPES
+    except TypeError:
+        known = False
+    return workout_type if known else UNKNOWN_LABEL
+
+
+def escape_label(value: str) -> str:
+    """Экранировать значение метки для текстового формата Prometheus."""
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+@dataclass
+class Histogram:
+    """Гистограмма задержек этапа с фиксированными корзинами."""
+
+    counts: List[int] = field(
+        default_factory=lambda: [0] * (len(BUCKETS) + 1))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        """Учесть одно измерение."""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class Instrumentation:
+    """Сбор метрик этапов расчёта по типам тренировок.
+
+    Этапы: `read_package`, `calories`, `show_training_info`
+    и `get_message`.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._patches: List[Tuple[Any, str, bool, Any]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patches)
+
+    def observe(self, stage: str, label: str, seconds: float) -> None:
+        """Учесть время этапа для типа тренировки."""
+        key = (stage, label)
+        if key not in self.histograms:
+            self.histograms[key] = Histogram()
+        self.histograms[key].observe(seconds)
+
+    def _patch(self, owner: Any, name: str, wrapper: Callable) -> None:
+        own = name in vars(owner)
+        self._patches.append((owner, name, own, vars(owner).get(name)))
+        setattr(owner, name, wrapper)
+
+    def _timed_read_package(self, read_package: Callable) -> Callable:
+        observe = self.observe
+
+        @wraps(read_package)
+        def timed(workout_type: str, data: list) -> Training:
+            start = perf_counter_ns()
+            try:
+                return read_package(workout_type, data)
+            finally:
+                observe('read_package', workout_label(workout_type),
+                        (perf_counter_ns() - start) / 1e9)
+        return timed
+
+    def _timed_method(self, stage: str, method: Callable,
+                      label: Callable[[Any], str]) -> Callable:
+        observe = self.observe
+
+        @wraps(method)
+        def timed(obj: Any, *args: Any) -> Any:
+            start = perf_counter_ns()
+            try:
+                return method(obj, *args)
+            finally:
+                observe(stage, label(obj),
+                        (perf_counter_ns() - start) / 1e9)
+        return timed
+
+    def enable(self) -> 'Instrumentation':
+        """Подменить функции расчёта обёртками с замером времени."""
+        if self.enabled:
+            return self
+        read_package = homework.read_package
+        timed_read_package = self._timed_read_package(read_package)
+        for module in list(sys.modules.values()):
+            if getattr(module, 'read_package', None) is read_package:
+                self._patch(module, 'read_package', timed_read_package)
+
+        def class_name(obj: Any) -> str:
+            return obj.__class__.__name__
+
+        for training_class in set(WORKOUT_TYPES.values()):
+            # унаследованный расчёт замеряет обёртка в классе-владельце
+            if 'get_spent_calories' not in vars(training_class):
+                continue
+            self._patch(training_class, 'get_spent_calories',
+                        self._timed_method(
+                            'calories', training_class.get_spent_calories,
+                            class_name))
+        self._patch(Training, 'show_training_info', self._timed_method(
+            'show_training_info', Training.show_training_info, class_name))
+        self._patch(InfoMessage, 'get_message', self._timed_method(
+            'get_message', InfoMessage.get_message,
+            lambda message: message.training_type))
+        return self
+
+    def disable(self) -> None:
+        """Вернуть исходные функции."""
+        for owner, name, own, original in reversed(self._patches):
+            if own:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+        self._patches = []
+
+    def __enter__(self) -> 'Instrumentation':
+        return self.enable()
+
+    def __exit__(self, *args: Any) -> None:
+        self.disable()
+
+    def reset(self) -> None:
+        """Сбросить накопленные метрики."""
+        self.histograms = {}
+
+    def to_prometheus(self) -> str:
+        """Метрики в текстовом формате Prometheus."""
+        lines = [f'# HELP {METRIC_NAME} Время этапов расчёта тренировок.',
+                 f'# TYPE {METRIC_NAME} histogram']
+        for (stage, label), histogram in sorted(self.histograms.items()):
+            labels = (f'stage="{escape_label(stage)}",'
+                      f'workout="{escape_label(label)}"')
+            cumulative = 0
+            for bound, count in zip(BUCKETS + (float('inf'),),
+                                    histogram.counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} '
+                             f'{cumulative}')
+            lines.append(f'{METRIC_NAME}_sum{{{labels}}} {histogram.total!r}')
+            lines.append(f'{METRIC_NAME}_count{{{labels}}} '
+                         f'{histogram.count}')
+        lines.append('')
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Метрики в виде словаря для JSON."""
+        metrics = {}
+        for (stage, label), histogram in self.histograms.items():
+            metrics[f'{stage}/{label}'] = {
+                'count': histogram.count,
+                'seconds': histogram.total,
+                'mean_ns': histogram.total / histogram.count * 1e9,
+                'buckets': dict(zip(map(repr, BUCKETS + (float('inf'),)),
+                                    histogram.counts))
+            }
+        return metrics
+
+    def write(self, path: str) -> None:
+        """Сохранить метрики: `.json` - в JSON, иначе для Prometheus."""
+        with open(path, 'w', encoding='utf-8') as file:
+            if path.endswith('.json'):
+                json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+            else:
+                file.write(self.to_prometheus())
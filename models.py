@@ -0,0 +1,154 @@
+"""Реестр моделей расчёта калорий с наборами коэффициентов.
+
+Модель - именованный набор значений констант классов тренировок
+(`RUN_SPEED_COEFF1`, `WALK_WEIGHT_COEF1`, `ADD_SPEED` и т.д.). Наборы
+читаются из JSON и один раз превращаются в подклассы тренировок с
+подменёнными константами, поэтому модели работают и с объектами, и с
+пакетным расчётом `batch` без изменений в формулах.
+
+Формат файла::
+
+    {"device-a": {"RUN": {"RUN_SPEED_COEFF1": 17.5}},
+     "senior": {"WLK": {"WALK_WEIGHT_COEF1": 0.04}}}
+"""
+import json
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from numbers import Real
+from typing import (Any, Dict, Iterable, List, Mapping, Sequence, Tuple,
+                    Type)
+
+from batch import Results, compute_class_batch, packages_to_columns
+from homework import WORKOUT_ARITY, WORKOUT_TYPES, Training
+from streaming import Package
+
+DEFAULT_MODEL: str = 'default'
+
+Coefficients = Mapping[str, Mapping[str, float]]  # тип: {константа: число}
+
+
+def constant_names(training_class: Type[Training]) -> List[str]:
+    """Числовые константы класса, которые может менять модель."""
+    return sorted(name for name in dir(training_class)
+                  if name.isupper()
+                  and isinstance(getattr(training_class, name), Real))
+
+
+def compile_class(training_class: Type[Training],
+                  constants: Mapping[str, float]) -> Type[Training]:
+    """Подкласс тренировки с другими значениями констант.
+
+    Имя класса сохраняется, чтобы сообщения не отличались от исходных.
+    Для одинаковых констант возвращается один и тот же подкласс.
+    """
+    allowed = constant_names(training_class)
+    unknown = sorted(set(constants) - set(allowed))
+    if unknown:
+        raise ValueError(f'У класса {training_class.__name__} нет '
+                         f'констант: {", ".join(unknown)}.')
+    for name, value in constants.items():
+        if not isinstance(value, Real) or isinstance(value, bool):
+            raise TypeError(f'Константа {name} должна быть числом, '
+                            f'получено {value!r}.')
+    return _compile(training_class, tuple(sorted(constants.items())))
+
+
+@lru_cache(maxsize=None)
+def _compile(training_class: Type[Training],
+             constants: Tuple[Tuple[str, float], ...]) -> Type[Training]:
+    namespace = dict(constants, __slots__=(),
+                     __module__=training_class.__module__,
+                     __qualname__=training_class.__qualname__,
+                     __reduce__=_reduce, _constants=constants)
+    return type(training_class.__name__, (training_class,), namespace)
+
+
+def _reduce(self: Training) -> Tuple[Any, ...]:
+    """Сериализация по исходному классу, константам и полям.
+
+    Подкласс нельзя найти по имени модуля, поэтому `pickle` получает
+    способ собрать его заново, например в другом процессе.
+    """
+    cls = type(self)
+    data = tuple(getattr(self, item.name) for item in fields(self))
+    return _rebuild, (cls.__mro__[1], cls._constants, data)
+
+
+def _rebuild(training_class: Type[Training],
+             constants: Tuple[Tuple[str, float], ...],
+             data: Sequence[float]) -> Training:
+    return _compile(training_class, constants)(*data)
+
+
+@dataclass
+class CalorieModel:
+    """Набор коэффициентов и классы тренировок, собранные по нему."""
+
+    name: str
+    coefficients: Coefficients = field(default_factory=dict)
+    classes: Dict[str, Type[Training]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        unknown = sorted(set(self.coefficients) - set(WORKOUT_TYPES))
+        if unknown:
+            raise ValueError(', '.join(unknown))
+        self.classes = dict(WORKOUT_TYPES)
+        for workout_type, constants in self.coefficients.items():
+            if constants:
+                self.classes[workout_type] = compile_class(
+                    WORKOUT_TYPES[workout_type], constants)
+
+    def read_package(self, workout_type: str, data: Sequence[float]
+                     ) -> Training:
+        """Прочитать пакет в класс тренировки этой модели."""
+        if workout_type not in self.classes:
+            raise ValueError(workout_type)
+        if len(data) != WORKOUT_ARITY[workout_type]:
+            raise TypeError(f'В данных тренировки {workout_type} передано '
+                            f'неверное количество элементов: {len(data)} '
+                            f'вместо {WORKOUT_ARITY[workout_type]}.')
+        return self.classes[workout_type](*data)
+
+    def compute_batch(self, workout_type: str,
+                      columns: Mapping[str, Sequence[float]]) -> Results:
+        """Пакетно рассчитать столбцы тренировок по этой модели."""
+        if workout_type not in self.classes:
+            raise ValueError(workout_type)
+        return compute_class_batch(self.classes[workout_type], columns)
+
+
+MODELS: Dict[str, CalorieModel] = {DEFAULT_MODEL: CalorieModel(DEFAULT_MODEL)}
+
+
+def register_model(name: str, coefficients: Coefficients) -> CalorieModel:
+    """Собрать модель и добавить её в реестр под именем `name`."""
+    model = CalorieModel(name, coefficients)
+    MODELS[name] = model
+    return model
+
+
+def load_models(path: str) -> List[CalorieModel]:
+    """Загрузить модели из JSON-файла и зарегистрировать их."""
+    with open(path, encoding='utf-8') as file:
+        config = json.load(file)
+    return [register_model(name, coefficients)
+            for name, coefficients in config.items()]
+
+
+def compare_models(packages: Iterable[Package],
+                   names: Sequence[str]) -> Dict[str, Dict[str, Results]]:
+    """Рассчитать пакеты по нескольким моделям за один проход данных.
+
+    Пакеты раскладываются по столбцам один раз, затем каждая модель
+    считает их пакетно. Результат: модель -> тип тренировки -> столбцы.
+    """
+    models = [MODELS[name] for name in names]
+    groups: Dict[str, List[Sequence[float]]] = {}
+    for workout_type, data in packages:
+        groups.setdefault(workout_type, []).append(data)
+    columns = {workout_type: packages_to_columns(workout_type, items)
+               for workout_type, items in groups.items()}
+    return {model.name: {workout_type: model.compute_batch(workout_type,
+                                                           type_columns)
+                         for workout_type, type_columns in columns.items()}
+            for model in models}
@@ -0,0 +1,144 @@
+"""Параллельная обработка больших наборов пакетов на нескольких ядрах."""
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import (Callable, Deque, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, TypeVar)
+
+from homework import InfoMessage, error_message, read_package
+from streaming import PACKAGE_ERRORS, Package
+
+CHUNK_SIZE: int = 5_000
+WINDOW_PER_WORKER: int = 2  # порций в работе на один процесс
+POLL_SECONDS: float = 0.01
+
+Task = TypeVar('Task')
+Result = TypeVar('Result')
+
+
+@dataclass
+class PackageError:
+    """Ошибка в пакете с его номером во входных данных."""
+
+    index: int
+    workout_type: str
+    message: str
+
+
+@dataclass
+class ChunkResult:
+    """Результат обработки одной порции пакетов."""
+
+    start: int
+    infos: List[Optional[InfoMessage]]
+    errors: List[PackageError] = field(default_factory=list)
+
+
+@dataclass
+class ParallelResult:
+    """Объединённые результаты и ошибки всех порций."""
+
+    infos: List[Optional[InfoMessage]] = field(default_factory=list)
+    errors: List[PackageError] = field(default_factory=list)
+
+
+def process_chunk(chunk: Tuple[int, Sequence[Package]]) -> ChunkResult:
+    """Обработать порцию пакетов, собирая ошибки вместо исключений."""
+    start, packages = chunk
+    result = ChunkResult(start, [])
+    for index, (workout_type, data) in enumerate(packages, start):
+        try:
+            info = read_package(workout_type, data).show_training_info()
+        except PACKAGE_ERRORS as err:
+            info = None
+            result.errors.append(
+                PackageError(index, workout_type, error_message(err)))
+        result.infos.append(info)
+    return result
+
+
+def iter_chunks(packages: Iterable[Package],
+                chunk_size: int = CHUNK_SIZE
+                ) -> Iterator[Tuple[int, List[Package]]]:
+    """Лениво разбить пакеты на порции с номером первого пакета."""
+    packages = iter(packages)
+    start = 0
+    while True:
+        chunk = list(islice(packages, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def iter_bounded(pool: Pool, function: Callable[[Task], Result],
+                 tasks: Iterable[Task], window: int,
+                 ordered: bool = True) -> Iterator[Result]:
+    """Выполнять задачи в пуле, держа в работе не больше `window`.
+
+    В отличие от `Pool.imap`, следующая задача берётся из `tasks`
+    только после того, как освободилось место, поэтому входные данные
+    читаются по мере обработки.
+    """
+    pending: Deque[AsyncResult] = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(function, (task,)))
+        if len(pending) >= window:
+            yield _next_result(pending, ordered)
+    while pending:
+        yield _next_result(pending, ordered)
+
+
+def _next_result(pending: Deque[AsyncResult], ordered: bool) -> Result:
+    """Забрать самый старый результат или, без порядка, любой готовый."""
+    if ordered:
+        return pending.popleft().get()
+    while True:
+        for result in pending:
+            if result.ready():
+                pending.remove(result)
+                return result.get()
+        pending[0].wait(POLL_SECONDS)
+
+
+def iter_parallel(packages: Iterable[Package],
+                  workers: Optional[int] = None,
+                  chunk_size: int = CHUNK_SIZE,
+                  ordered: bool = True) -> Iterator[ChunkResult]:
+    """Обработать порции в пуле процессов и отдавать их по готовности.
+
+    В работе одновременно не больше `WINDOW_PER_WORKER` порций на
+    процесс, остальные пакеты ещё не прочитаны из входа.
+    """
+    chunks = iter_chunks(packages, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(process_chunk, chunks)
+        return
+    with Pool(workers) as pool:
+        yield from iter_bounded(pool, process_chunk, chunks,
+                                WINDOW_PER_WORKER * workers, ordered)
+
+
+def process_parallel(packages: Iterable[Package],
+                     workers: Optional[int] = None,
+                     chunk_size: int = CHUNK_SIZE,
+                     ordered: bool = True) -> ParallelResult:
+    """Обработать пакеты параллельно и объединить результаты.
+
+    При `ordered=False` сообщения идут в порядке готовности порций,
+    а пакеты с ошибками пропускаются.
+    """
+    result = ParallelResult()
+    for chunk in iter_parallel(packages, workers, chunk_size, ordered):
+        if ordered:
+            result.infos.extend(chunk.infos)
+        else:
+            result.infos.extend(info for info in chunk.infos
+                                if info is not None)
+        result.errors.extend(chunk.errors)
+    result.errors.sort(key=lambda error: error.index)
+    return result
@@ -0,0 +1,138 @@
+"""Пересчёт только тех сохранённых тренировок, которые затронуло изменение.
+
+Зависимости строк хранилища известны по классам тренировок:
+- поле пакета (`weight`, `height`) - строки пользователя, у класса
+  которых есть это поле, и только те, где значение действительно
+  меняется;
+- константа класса (`ADD_SPEED`, `RUN_SPEED_COEFF1`) - строки типов, в
+  модели которых изменилось значение константы.
+
+Затронутые строки пересчитываются пакетно, перезаписываются в
+хранилище одной транзакцией на пачку, а итоги агрегатора меняются на
+разницу старого и нового сообщения.
+"""
+from dataclasses import dataclass, fields, replace
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from aggregation import Aggregator
+from batch import packages_to_columns, results_to_info
+from homework import WORKOUT_TYPES
+from models import DEFAULT_MODEL, MODELS, CalorieModel, Coefficients
+from store import StoredTraining, TrainingStore
+
+USER_FIELDS = ('weight', 'height')  # поля пакета, общие для тренировок
+
+
+@dataclass
+class ChangeResult:
+    """Число пересчитанных строк и изменение суммы калорий."""
+
+    rows: int = 0
+    calories_delta: float = 0.0
+
+
+def field_dependents(name: str) -> List[str]:
+    """Типы тренировок, у которых есть поле пакета `name`."""
+    return [workout_type for workout_type, training_class
+            in WORKOUT_TYPES.items()
+            if name in {item.name for item in fields(training_class)}]
+
+
+def constant_dependents(model: CalorieModel,
+                        coefficients: Coefficients) -> List[str]:
+    """Типы тренировок, для которых константы отличаются от модели."""
+    return [workout_type for workout_type, constants in coefficients.items()
+            if any(getattr(model.classes[workout_type], name, None) != value
+                   for name, value in constants.items())]
+
+
+class RecomputeEngine:
+    """Применение изменений к хранилищу и итогам агрегатора."""
+
+    def __init__(self, store: TrainingStore,
+                 model: Optional[CalorieModel] = None,
+                 aggregator: Optional[Aggregator] = None) -> None:
+        self.store = store
+        self.model = model or MODELS[DEFAULT_MODEL]
+        self.aggregator = aggregator
+
+    def recompute(self, trainings: Iterable[StoredTraining]) -> ChangeResult:
+        """Пересчитать строки по текущей модели и сохранить изменения."""
+        groups: Dict[str, List[StoredTraining]] = {}
+        for training in trainings:
+            groups.setdefault(training.workout_type, []).append(training)
+        result = ChangeResult()
+        updated: List[StoredTraining] = []
+        for workout_type, items in groups.items():
+            columns = packages_to_columns(workout_type,
+                                          [item.data for item in items])
+            infos = results_to_info(
+                self.model.classes[workout_type],
+                self.model.compute_batch(workout_type, columns))
+            for item, info in zip(items, infos):
+                if self.aggregator is not None:
+                    self.aggregator.replace(item.user, item.day, item.info,
+                                            info)
+                result.calories_delta += info.calories - item.info.calories
+                updated.append(StoredTraining(item.id, item.user, item.day,
+                                              workout_type, item.data,
+                                              info))
+        result.rows = self.store.update_many(updated)
+        return result
+
+    def set_user_field(self, user: str, name: str, value: float,
+                       start: Optional[date] = None,
+                       end: Optional[date] = None) -> ChangeResult:
+        """Изменить поле пакета во всех тренировках пользователя.
+
+        `start` и `end` ограничивают дни, например новым весом с
+        определённой даты. Меняются только свойства пользователя из
+        `USER_FIELDS`, а не данные отдельной тренировки.
+        """
+        if name not in USER_FIELDS:
+            raise ValueError(f'Поле {name} не относится к пользователю, '
+                             f'допустимы: {", ".join(USER_FIELDS)}.')
+        workout_types = field_dependents(name)
+        changed = []
+        for workout_type in workout_types:
+            position = [item.name for item in
+                        fields(WORKOUT_TYPES[workout_type])].index(name)
+            for training in self.store.query(user, start, end, workout_type):
+                if training.data[position] == value:
+                    continue
+                data = list(training.data)
+                data[position] = value
+                changed.append(replace(training, data=tuple(data)))
+        return self.recompute(changed)
+
+    def set_constants(self, coefficients: Coefficients) -> ChangeResult:
+        """Перейти на новые значения констант и пересчитать их типы.
+
+        Строки читаются и пересчитываются страницами по `batch_size`
+        хранилища, поэтому память не зависит от длины истории. Страница
+        читается целиком до записи, выборка не остаётся открытой.
+        """
+        merged = {workout_type: dict(constants)
+                  for workout_type, constants
+                  in self.model.coefficients.items()}
+        for workout_type, constants in coefficients.items():
+            merged.setdefault(workout_type, {}).update(constants)
+        model = CalorieModel(self.model.name, merged)
+        workout_types = constant_dependents(self.model, coefficients)
+        self.model = model
+        result = ChangeResult()
+        for workout_type in workout_types:
+            for page in self.store.query_pages(workout_type):
+                change = self.recompute(page)
+                result.rows += change.rows
+                result.calories_delta += change.calories_delta
+        return result
+
+
+def rebuild_aggregator(store: TrainingStore) -> Aggregator:
+    """Собрать итоги агрегатора заново по всем строкам хранилища."""
+    aggregator = Aggregator()
+    for training in store.query():
+        aggregator.add(training.user, training.day, training.info)
+    return aggregator
@@ -0,0 +1,229 @@
+"""Запись отчётов о тренировках во множество файлов по разделам.
+
+Сообщения копятся в памяти по разделам (пользователь, дата) и пишутся
+в файл одной операцией, когда буфер раздела заполнен. Сжатие gzip
+выполняется в фоновом потоке, чтобы не задерживать расчёт. Каждый
+процесс пишет в свои файлы `раздел.процесс.txt`, поэтому параллельным
+процессам не нужны блокировки.
+"""
+import gzip
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import (Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
+
+from homework import InfoMessage, error_message, read_package
+from parallel import (CHUNK_SIZE, WINDOW_PER_WORKER, PackageError,
+                      iter_bounded, iter_chunks)
+from streaming import PACKAGE_ERRORS
+
+BUFFER_LINES: int = 2048  # строк в буфере раздела
+COMPRESS_LEVEL: int = 6
+
+Record = Tuple[str, str, Sequence[float]]  # раздел, тип, данные
+
+
+def shard_path(directory: str, shard: str,
+               worker: Optional[Union[int, str]] = None,
+               compress: bool = False) -> str:
+    """Путь к файлу раздела для процесса `worker`."""
+    if not isinstance(shard, str):
+        raise TypeError(f'Имя раздела должно быть строкой, получено '
+                        f'{shard!r}.')
+    if (not shard or shard.startswith('.') or '\0' in shard
+            or os.sep in shard or (os.altsep and os.altsep in shard)):
+        raise ValueError(f'Недопустимое имя раздела: {shard!r}.')
+    name = shard if worker is None else f'{shard}.{worker}'
+    return os.path.join(directory, name + ('.txt.gz' if compress
+                                           else '.txt'))
+
+
+class _Compressor(threading.Thread):
+    """Фоновый поток: сжимает блоки и дописывает их в файлы."""
+
+    def __init__(self, level: int) -> None:
+        super().__init__(daemon=True)
+        self.level = level
+        self.blocks: 'queue.Queue[Optional[Tuple[str, bytes]]]' = (
+            queue.Queue())
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        while True:
+            block = self.blocks.get()
+            if block is None:
+                return
+            if self.error is not None:
+                continue
+            path, data = block
+            try:
+                with open(path, 'ab') as file:
+                    file.write(gzip.compress(data, self.level))
+            except OSError as err:
+                self.error = err
+
+
+class ShardedReportWriter:
+    """Буферизованная запись сообщений в файлы разделов.
+
+    Файлы открываются только на время сброса буфера, поэтому число
+    разделов не ограничено числом открытых дескрипторов. Сжатые блоки
+    дописываются отдельными членами gzip, файл читается `gzip.open`.
+    """
+
+    def __init__(self, directory: str,
+                 worker: Optional[Union[int, str]] = None,
+                 buffer_lines: int = BUFFER_LINES,
+                 compress: bool = False,
+                 level: int = COMPRESS_LEVEL) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.worker = worker
+        self.buffer_lines = buffer_lines
+        self.compress = compress
+        self.lines = 0
+        self._buffers: Dict[str, List[str]] = {}
+        self._compressor: Optional[_Compressor] = None
+        if compress:
+            self._compressor = _Compressor(level)
+            self._compressor.start()
+
+    def write(self, shard: str, info: InfoMessage) -> None:
+        """Добавить сообщение в раздел."""
+        line = info.get_message()
+        buffer = self._buffers.get(shard)
+        if buffer is None:
+            buffer = self._add_shard(shard)
+        buffer.append(line)
+        self.lines += 1
+        if len(buffer) >= self.buffer_lines:
+            self.flush_shard(shard)
+
+    def write_many(self, shard: str, infos: Iterable[InfoMessage]) -> None:
+        """Добавить несколько сообщений в раздел."""
+        self.write_lines(shard, [info.get_message() for info in infos])
+
+    def write_lines(self, shard: str, lines: List[str]) -> None:
+        """Добавить готовые строки в раздел."""
+        buffer = self._buffers.get(shard)
+        if buffer is None:
+            buffer = self._add_shard(shard)
+        buffer.extend(lines)
+        self.lines += len(lines)
+        if len(buffer) >= self.buffer_lines:
+            self.flush_shard(shard)
+
+    def _add_shard(self, shard: str) -> List[str]:
+        shard_path(self.directory, shard)
+        buffer = self._buffers[shard] = []
+        return buffer
+
+    def paths(self) -> Iterator[str]:
+        """Пути файлов разделов, в которые писал этот объект."""
+        for shard in self._buffers:
+            yield shard_path(self.directory, shard, self.worker,
+                             self.compress)
+
+    def flush_shard(self, shard: str) -> None:
+        """Записать буфер раздела одной операцией."""
+        lines = self._buffers.get(shard)
+        if not lines:
+            return
+        lines.append('')
+        data = '\n'.join(lines).encode('utf-8')
+        self._buffers[shard] = []
+        path = shard_path(self.directory, shard, self.worker, self.compress)
+        if self._compressor is None:
+            with open(path, 'ab') as file:
+                file.write(data)
+        else:
+            self._compressor.blocks.put((path, data))
+
+    def flush(self) -> None:
+        """Записать буферы всех разделов."""
+        for shard in self._buffers:
+            self.flush_shard(shard)
+
+    def close(self) -> None:
+        """Записать буферы и дождаться фонового сжатия."""
+        self.flush()
+        compressor = self._compressor
+        if compressor is None:
+            return
+        self._compressor = None
+        compressor.blocks.put(None)
+        compressor.join()
+        if compressor.error is not None:
+            raise compressor.error
+
+    def __enter__(self) -> 'ShardedReportWriter':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+@dataclass
+class ReportResult:
+    """Число записанных строк и ошибки в пакетах."""
+
+    lines: int = 0
+    errors: List[PackageError] = field(default_factory=list)
+
+
+def write_chunk(task: Tuple[str, bool, int, List[Record]]
+                ) -> ReportResult:
+    """Рассчитать порцию записей и дописать её в файлы процесса."""
+    directory, compress, start, records = task
+    result = ReportResult()
+    with ShardedReportWriter(directory, os.getpid(),
+                             compress=compress) as writer:
+        for index, (shard, workout_type, data) in enumerate(records, start):
+            try:
+                info = read_package(workout_type, data).show_training_info()
+            except PACKAGE_ERRORS as err:
+                result.errors.append(
+                    PackageError(index, workout_type, error_message(err)))
+                continue
+            try:
+                writer.write(shard, info)
+            except (ValueError, TypeError) as err:
+                result.errors.append(PackageError(index, workout_type,
+                                                  str(err)))
+        result.lines = writer.lines
+    return result
+
+
+def write_reports(records: Iterable[Record], directory: str,
+                  workers: Optional[int] = None,
+                  chunk_size: int = CHUNK_SIZE,
+                  compress: bool = False) -> ReportResult:
+    """Рассчитать записи в пуле процессов и разложить отчёты по файлам.
+
+    Каждый процесс дописывает свои файлы `раздел.pid.txt`; порядок
+    строк внутри раздела сохраняется в пределах файла процесса. Записи
+    читаются по мере освобождения процессов, недопустимое имя раздела
+    попадает в ошибки пакета.
+    """
+    tasks = ((directory, compress, start, chunk)
+             for start, chunk in iter_chunks(records, chunk_size))
+    workers = workers or os.cpu_count() or 1
+    result = ReportResult()
+    for chunk in _iter_written(tasks, workers):
+        result.lines += chunk.lines
+        result.errors.extend(chunk.errors)
+    result.errors.sort(key=lambda error: error.index)
+    return result
+
+
+def _iter_written(tasks: Iterable[Tuple[str, bool, int, List[Record]]],
+                  workers: int) -> Iterator[ReportResult]:
+    if workers == 1:
+        yield from map(write_chunk, tasks)
+        return
+    with Pool(workers) as pool:
+        yield from iter_bounded(pool, write_chunk, tasks,
+                                WINDOW_PER_WORKER * workers, ordered=False)
@@ -0,0 +1,203 @@
+"""Асинхронный сервер приёма пакетов от трекеров.
+
+Протокол - строки JSON. Запрос: `{"id": 1, "workout_type": "RUN",
+"data": [15000, 1, 75]}`, ответ: `{"id": 1, "message": "..."}` или
+`{"id": 1, "error": "..."}`. Ответы приходят в порядке запросов.
+"""
+import argparse
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from homework import error_message, read_package
+from streaming import PACKAGE_ERRORS
+
+MAX_BATCH: int = 256
+MAX_DELAY: float = 0.002
+QUEUE_SIZE: int = 10_000
+CONNECTION_LIMIT: int = 64
+LINE_LIMIT: int = 64 * 2**10  # байт в строке запроса
+
+Job = Tuple[str, list, asyncio.Future]
+
+
+def process_package(workout_type: str, data: list) -> Dict[str, str]:
+    """Рассчитать сообщение о тренировке или описание ошибки."""
+    try:
+        training = read_package(workout_type, data)
+        return {'message': training.show_training_info().get_message()}
+    except PACKAGE_ERRORS as err:
+        return {'error': error_message(err)}
+
+
+async def read_line(reader: asyncio.StreamReader
+                    ) -> Tuple[Optional[bytes], bool]:
+    """Прочитать строку запроса: (строка или None в конце, слишком длинная).
+
+    Слишком длинная строка пропускается целиком до перевода строки,
+    чтобы следующие запросы соединения читались с начала.
+    """
+    too_long = False
+    while True:
+        try:
+            line: Optional[bytes] = await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as err:
+            line = err.partial or None
+        except asyncio.LimitOverrunError as err:
+            await reader.read(err.consumed)
+            too_long = True
+            continue
+        if too_long:
+            return (None if line is None else b''), True
+        return line, False
+
+
+class TrainingServer:
+    """Сервер, собирающий запросы всех соединений в небольшие пакеты.
+
+    Очередь расчёта ограничена `queue_size`: при её заполнении сервер
+    перестаёт читать из сокетов. Каждое соединение держит не больше
+    `connection_limit` запросов без ответа.
+    """
+
+    def __init__(self, max_batch: int = MAX_BATCH,
+                 max_delay: float = MAX_DELAY,
+                 queue_size: int = QUEUE_SIZE,
+                 connection_limit: int = CONNECTION_LIMIT,
+                 line_limit: int = LINE_LIMIT) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue_size = queue_size
+        self.connection_limit = connection_limit
+        self.line_limit = line_limit
+        self.batches = 0
+        self.requests = 0
+        self._queue: Optional['asyncio.Queue[Job]'] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '127.0.0.1',
+                    port: int = 0) -> asyncio.AbstractServer:
+        """Запустить сервер и обработчик пакетов."""
+        self._queue = asyncio.Queue(self.queue_size)
+        self._batcher = asyncio.create_task(self._run_batches())
+        self._server = await asyncio.start_server(
+            self._handle, host, port, limit=self.line_limit)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        """Порт, на котором слушает сервер."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Остановить приём соединений и обработчик пакетов."""
+        self._server.close()
+        await self._server.wait_closed()
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+
+    async def _collect_batch(self) -> List[Job]:
+        """Дождаться запроса и добрать пакет в пределах задержки."""
+        loop = asyncio.get_running_loop()
+        jobs = [await self._queue.get()]
+        deadline = loop.time() + self.max_delay
+        while len(jobs) < self.max_batch:
+            if not self._queue.empty():
+                jobs.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                jobs.append(await asyncio.wait_for(self._queue.get(),
+                                                   timeout))
+            except asyncio.TimeoutError:
+                break
+        return jobs
+
+    async def _run_batches(self) -> None:
+        while True:
+            jobs = await self._collect_batch()
+            self.batches += 1
+            self.requests += len(jobs)
+            for workout_type, data, future in jobs:
+                if not future.cancelled():
+                    future.set_result(process_package(workout_type, data))
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        """Читать запросы соединения и отдавать ответы по порядку."""
+        pending: 'asyncio.Queue[Optional[Tuple[Any, asyncio.Future]]]' = (
+            asyncio.Queue(self.connection_limit))
+        replies = asyncio.create_task(self._reply(writer, pending))
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line, too_long = await read_line(reader)
+                future = loop.create_future()
+                request_id = None
+                if too_long:
+                    future.set_result({'error': f'Некорректный запрос: '
+                                                f'строка длиннее '
+                                                f'{self.line_limit} байт'})
+                    await pending.put((request_id, future))
+                if line is None:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    request_id = request.get('id')
+                    job = (request['workout_type'], request['data'], future)
+                except (ValueError, KeyError, AttributeError) as err:
+                    future.set_result({'error': f'Некорректный запрос: '
+                                                f'{err!r}'})
+                else:
+                    await self._queue.put(job)
+                await pending.put((request_id, future))
+        except ConnectionError:
+            pass
+        finally:
+            await pending.put(None)
+            await replies
+
+    async def _reply(self, writer: asyncio.StreamWriter,
+                     pending: asyncio.Queue) -> None:
+        try:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                request_id, future = item
+                reply = {'id': request_id, **await future}
+                writer.write(json.dumps(reply, ensure_ascii=False).encode()
+                             + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            while await pending.get() is not None:
+                pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int) -> None:
+    """Запустить сервер и работать до остановки."""
+    server = await TrainingServer().start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
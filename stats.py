@@ -0,0 +1,276 @@
+"""Потоковая статистика по результатам тренировок в ограниченной памяти.
+
+Лидеры среди пользователей по сумме калорий и дистанции считаются
+алгоритмом Misra-Gries: хранится не больше `capacity` счётчиков, и
+пользователь с суммой больше `2 / capacity` от общей гарантированно
+попадает в таблицу, а его сумма оценена с точностью до этой доли.
+Таблица лидеров по отдельным тренировкам хранит только `n` лучших
+записей в куче, а квантили скорости оцениваются логарифмическим
+скетчем (как DDSketch): значение попадает в корзину
+`ceil(log(x) / log(gamma))`, поэтому относительная ошибка квантиля не
+больше `accuracy`, а число корзин зависит только от диапазона значений.
+Счётчики, кучи и скетчи объединяются через `merge`, так что статистику
+можно собирать в нескольких процессах и сложить.
+"""
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from homework import InfoMessage
+
+ACCURACY: float = 0.01
+TOP_SIZE: int = 10
+USER_CAPACITY: int = 1000  # счётчиков пользователей на таблицу лидеров
+QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+METRICS: Tuple[str, ...] = ('calories', 'distance')
+
+Entry = Tuple[float, str]  # значение, пользователь
+
+
+class TopN:
+    """`n` наибольших значений с ключами на неубывающей куче."""
+
+    def __init__(self, n: int = TOP_SIZE) -> None:
+        self.n = n
+        self.heap: List[Entry] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, value: float, key: str) -> None:
+        """Учесть значение, если оно входит в `n` лучших."""
+        if len(self.heap) < self.n:
+            heapq.heappush(self.heap, (value, key))
+        elif value > self.heap[0][0]:
+            heapq.heapreplace(self.heap, (value, key))
+
+    def merge(self, other: 'TopN') -> None:
+        """Добавить лучшие записи другой кучи."""
+        for value, key in other.heap:
+            self.push(value, key)
+
+    def items(self) -> List[Entry]:
+        """Записи от большего значения к меньшему."""
+        return sorted(self.heap, reverse=True)
+
+
+class HeavyHitters:
+    """Приближённые суммы по ключам для самых весомых ключей.
+
+    Вариант Misra-Gries: пока ключей не больше `capacity`, суммы
+    точные. Когда ключей становится больше, из всех сумм вычитается
+    медиана, а ключи с неположительной суммой выбрасываются. Вычтенное
+    копится в `offset`: это наибольшее занижение суммы любого ключа,
+    и оно не больше `2 / capacity` от общей суммы.
+    """
+
+    def __init__(self, capacity: int = USER_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f'Число счётчиков должно быть положительным: '
+                             f'{capacity}.')
+        self.capacity = capacity
+        self.offset = 0.0
+        self.counts: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def add(self, key: str, weight: float) -> None:
+        """Прибавить неотрицательный `weight` к сумме ключа."""
+        if not weight >= 0:
+            raise ValueError(f'Вес должен быть неотрицательным: {weight}.')
+        counts = self.counts
+        if key in counts:
+            counts[key] += weight
+        elif weight:
+            counts[key] = weight
+            if len(counts) > self.capacity:
+                self._purge()
+
+    def _purge(self) -> None:
+        """Вычесть медиану сумм и выбросить ключи, оставшиеся без неё."""
+        counts = self.counts
+        median = sorted(counts.values())[len(counts) // 2]
+        self.offset += median
+        self.counts = {key: count - median for key, count in counts.items()
+                       if count > median}
+
+    def estimate(self, key: str) -> float:
+        """Оценка суммы ключа сверху."""
+        return self.counts.get(key, 0.0) + self.offset
+
+    def merge(self, other: 'HeavyHitters') -> None:
+        """Прибавить счётчики, собранные в другом процессе."""
+        counts = self.counts
+        for key, count in other.counts.items():
+            counts[key] = counts.get(key, 0.0) + count
+        self.offset += other.offset
+        while len(self.counts) > self.capacity:
+            self._purge()
+
+    def items(self, n: Optional[int] = None) -> List[Entry]:
+        """Оценки сверху от большей к меньшей, первые `n` или все."""
+        offset = self.offset
+        entries = [(count + offset, key)
+                   for key, count in self.counts.items()]
+        if n is None:
+            return sorted(entries, reverse=True)
+        return heapq.nlargest(n, entries)
+
+
+@dataclass
+class QuantileSketch:
+    """Скетч квантилей положительных значений с относительной ошибкой.
+
+    Значения не больше `min_value` учитываются как ноль.
+    """
+
+    accuracy: float = ACCURACY
+    min_value: float = 1e-9
+    count: int = 0
+    zero_count: int = 0
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.accuracy < 1:
+            raise ValueError(f'Точность должна быть в интервале (0, 1): '
+                             f'{self.accuracy}.')
+        self.gamma = (1 + self.accuracy) / (1 - self.accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+    def add(self, value: float) -> None:
+        """Учесть значение."""
+        self.count += 1
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Прибавить скетч с той же точностью."""
+        if other.accuracy != self.accuracy:
+            raise ValueError(f'Нельзя объединить скетчи с точностью '
+                             f'{self.accuracy} и {other.accuracy}.')
+        self.count += other.count
+        self.zero_count += other.zero_count
+        buckets = self.buckets
+        for index, count in other.buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """Оценка квантиля `q` из [0, 1]; для пустого скетча - `nan`."""
+        if not 0 <= q <= 1:
+            raise ValueError(f'Квантиль должен быть в [0, 1]: {q}.')
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return 2 * self.gamma**index / (self.gamma + 1)
+        return 2 * self.gamma**max(self.buckets) / (self.gamma + 1)
+
+
+class TrainingStats:
+    """Лидеры по калориям и дистанции и квантили скорости по типам.
+
+    Лидеры-пользователи считаются по суммам за все их тренировки, без
+    отрицательного расхода калорий. Лидеры-тренировки считаются по
+    отдельным результатам: общим и по каждому `training_type`.
+    """
+
+    def __init__(self, top: int = TOP_SIZE,
+                 accuracy: float = ACCURACY,
+                 capacity: int = USER_CAPACITY) -> None:
+        self.top_size = top
+        self.accuracy = accuracy
+        self.capacity = capacity
+        self.tops: Dict[Tuple[str, Optional[str]], TopN] = {}
+        self.users: Dict[str, HeavyHitters] = {
+            metric: HeavyHitters(capacity) for metric in METRICS}
+        self.sketches: Dict[str, QuantileSketch] = {}
+        self._targets_cache: Dict[str, tuple] = {}
+
+    def _top(self, metric: str, training_type: Optional[str]) -> TopN:
+        key = (metric, training_type)
+        if key not in self.tops:
+            self.tops[key] = TopN(self.top_size)
+        return self.tops[key]
+
+    def _sketch(self, training_type: str) -> QuantileSketch:
+        if training_type not in self.sketches:
+            self.sketches[training_type] = QuantileSketch(self.accuracy)
+        return self.sketches[training_type]
+
+    def _targets(self, training_type: str
+                 ) -> Tuple[TopN, TopN, TopN, TopN, QuantileSketch]:
+        """Кучи и скетч, которые обновляет результат этого типа."""
+        if training_type not in self._targets_cache:
+            self._targets_cache[training_type] = (
+                self._top('calories', None),
+                self._top('calories', training_type),
+                self._top('distance', None),
+                self._top('distance', training_type),
+                self._sketch(training_type))
+        return self._targets_cache[training_type]
+
+    def add(self, user: str, info: InfoMessage) -> None:
+        """Учесть результат `show_training_info()` пользователя."""
+        calories, type_calories, distance, type_distance, sketch = (
+            self._targets(info.training_type))
+        calories.push(info.calories, user)
+        type_calories.push(info.calories, user)
+        distance.push(info.distance, user)
+        type_distance.push(info.distance, user)
+        users = self.users
+        users['calories'].add(user, info.calories if info.calories > 0
+                              else 0.0)
+        users['distance'].add(user, info.distance)
+        sketch.add(info.speed)
+
+    def add_many(self, results: Iterable[Tuple[str, InfoMessage]]) -> None:
+        """Учесть пары (пользователь, сообщение)."""
+        for user, info in results:
+            self.add(user, info)
+
+    def top(self, metric: str = 'calories',
+            training_type: Optional[str] = None) -> List[Entry]:
+        """Лучшие отдельные тренировки по показателю."""
+        if metric not in METRICS:
+            raise ValueError(f'Нет таблицы лидеров по показателю '
+                             f'{metric}.')
+        top = self.tops.get((metric, training_type))
+        return top.items() if top else []
+
+    def top_users(self, metric: str = 'calories') -> List[Entry]:
+        """Пользователи с наибольшей суммой показателя за все тренировки.
+
+        Суммы - оценки сверху; если пользователей больше `capacity`,
+        они завышены не больше чем на `users[metric].offset`.
+        """
+        if metric not in METRICS:
+            raise ValueError(f'Нет таблицы лидеров по показателю '
+                             f'{metric}.')
+        return self.users[metric].items(self.top_size)
+
+    def quantiles(self, training_type: str,
+                  qs: Sequence[float] = QUANTILES) -> Dict[float, float]:
+        """Квантили средней скорости для типа тренировки."""
+        sketch = self.sketches.get(training_type) or QuantileSketch(
+            self.accuracy)
+        return {q: sketch.quantile(q) for q in qs}
+
+    def merge(self, other: 'TrainingStats') -> None:
+        """Прибавить статистику, собранную в другом процессе."""
+        for (metric, training_type), top in other.tops.items():
+            self._top(metric, training_type).merge(top)
+        for metric, users in other.users.items():
+            self.users[metric].merge(users)
+        for training_type, sketch in other.sketches.items():
+            self._sketch(training_type).merge(sketch)
@@ -0,0 +1,240 @@
+"""Хранение тренировок и рассчитанных показателей в SQLite.
+
+Входные данные пакета и показатели `show_training_info()` пишутся в
+одну таблицу пачками через `executemany`, по одной транзакции на пачку,
+журнал - в режиме WAL. Индексы по пользователю, дню и типу тренировки
+обслуживают выборки истории.
+"""
+import sqlite3
+from dataclasses import dataclass, fields
+from datetime import date
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
+
+from homework import WORKOUT_TYPES, InfoMessage, Training, read_package
+
+BATCH_SIZE: int = 50_000
+CACHE_KIB: int = 128 * 2**10  # страничный кэш SQLite
+METRICS: Tuple[str, ...] = ('distance', 'speed', 'calories')
+
+Day = Union[date, str]
+Record = Tuple[str, Day, str, Sequence[float]]  # пользователь, день, тип
+
+
+def input_fields() -> List[str]:
+    """Поля всех зарегистрированных тренировок без повторов."""
+    names: List[str] = []
+    for training_class in WORKOUT_TYPES.values():
+        for item in fields(training_class):
+            if item.name not in names:
+                names.append(item.name)
+    return names
+
+
+INPUTS: Tuple[str, ...] = tuple(input_fields())
+DURATION: int = INPUTS.index('duration')
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS trainings (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    day TEXT NOT NULL,
+    workout_type TEXT NOT NULL,
+    {', '.join(f'{name} REAL' for name in INPUTS + METRICS)}
+);
+CREATE INDEX IF NOT EXISTS trainings_user_day ON trainings (user, day);
+CREATE INDEX IF NOT EXISTS trainings_day ON trainings (day);
+CREATE INDEX IF NOT EXISTS trainings_type_day
+    ON trainings (workout_type, day);
+"""
+
+COLUMNS: Tuple[str, ...] = ('id', 'user', 'day', 'workout_type') + (
+    INPUTS + METRICS)
+
+
+@dataclass
+class StoredTraining:
+    """Строка хранилища: входные данные пакета и показатели."""
+
+    id: int
+    user: str
+    day: date
+    workout_type: str
+    data: Tuple[float, ...]
+    info: InfoMessage
+
+    @property
+    def training(self) -> Training:
+        """Тренировка, восстановленная из входных данных."""
+        return WORKOUT_TYPES[self.workout_type](*self.data)
+
+
+def _day(day: Day) -> str:
+    return day.isoformat() if isinstance(day, date) else day
+
+
+class TrainingStore:
+    """Файл SQLite с тренировками и их показателями."""
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(f'PRAGMA cache_size=-{CACHE_KIB}')
+        self.connection.executescript(SCHEMA)
+        self._fields: Dict[str, List[int]] = {
+            workout_type: [INPUTS.index(item.name)
+                           for item in fields(training_class)]
+            for workout_type, training_class in WORKOUT_TYPES.items()}
+        placeholders = ', '.join('?' * (len(COLUMNS) - 1))
+        self._insert = (f'INSERT INTO trainings ({", ".join(COLUMNS[1:])}) '
+                        f'VALUES ({placeholders})')
+        assignments = ', '.join(f'{name} = ?' for name in INPUTS + METRICS)
+        self._update = f'UPDATE trainings SET {assignments} WHERE id = ?'
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'TrainingStore':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM trainings').fetchone()[0]
+
+    def _row(self, record: Record) -> List[Any]:
+        """Значения строки таблицы для пакета, без `id`."""
+        user, day, workout_type, data = record
+        info = read_package(workout_type, data).show_training_info()
+        return [user, _day(day), workout_type,
+                *self._inputs(workout_type, data),
+                info.distance, info.speed, info.calories]
+
+    def _inputs(self, workout_type: str,
+                data: Sequence[float]) -> List[Optional[float]]:
+        """Входные данные пакета по столбцам таблицы."""
+        inputs: List[Optional[float]] = [None] * len(INPUTS)
+        for position, value in zip(self._fields[workout_type], data):
+            inputs[position] = value
+        return inputs
+
+    def add_many(self, records: Iterable[Record]) -> int:
+        """Рассчитать и записать пакеты, вернуть число записанных строк.
+
+        Каждая пачка из `batch_size` строк пишется одной транзакцией;
+        ошибка в пакете отменяет только его пачку.
+        """
+        count = 0
+        rows = []
+        for record in records:
+            rows.append(self._row(record))
+            if len(rows) >= self.batch_size:
+                count += self._write(self._insert, rows)
+                rows = []
+        return count + self._write(self._insert, rows)
+
+    def add(self, user: str, day: Day, workout_type: str,
+            data: Sequence[float]) -> None:
+        """Рассчитать и записать один пакет."""
+        self.add_many([(user, day, workout_type, data)])
+
+    def _write(self, statement: str, rows: List[List[Any]]) -> int:
+        if rows:
+            with self.connection:
+                self.connection.executemany(statement, rows)
+        return len(rows)
+
+    def update_many(self, trainings: Iterable[StoredTraining]) -> int:
+        """Перезаписать входные данные и показатели строк по `id`."""
+        count = 0
+        rows = []
+        for training in trainings:
+            info = training.info
+            rows.append([*self._inputs(training.workout_type, training.data),
+                         info.distance, info.speed, info.calories,
+                         training.id])
+            if len(rows) >= self.batch_size:
+                count += self._write(self._update, rows)
+                rows = []
+        return count + self._write(self._update, rows)
+
+    def _load(self, row: Sequence[Any]) -> StoredTraining:
+        identifier, user, day, workout_type = row[:4]
+        inputs = row[4:4 + len(INPUTS)]
+        distance, speed, calories = row[4 + len(INPUTS):]
+        data = tuple(inputs[position]
+                     for position in self._fields[workout_type])
+        info = InfoMessage(WORKOUT_TYPES[workout_type].__name__,
+                           inputs[DURATION], distance, speed, calories)
+        return StoredTraining(identifier, user, date.fromisoformat(day),
+                              workout_type, data, info)
+
+    def query(self, user: Optional[str] = None,
+              start: Optional[Day] = None, end: Optional[Day] = None,
+              workout_type: Optional[str] = None
+              ) -> Iterator[StoredTraining]:
+        """Тренировки по условиям; границы дней включительно.
+
+        Выборка по пользователю всегда идёт по индексу (user, day):
+        без статистики ANALYZE планировщик может выбрать индекс по типу.
+        """
+        conditions = []
+        params: List[Any] = []
+        for column, operator, value in (
+                ('user', '=', user), ('day', '>=', start),
+                ('day', '<=', end), ('workout_type', '=', workout_type)):
+            if value is not None:
+                conditions.append(f'{column} {operator} ?')
+                params.append(_day(value))
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        if user is not None:
+            where = ' INDEXED BY trainings_user_day' + where
+        cursor = self.connection.execute(
+            f'SELECT {", ".join(COLUMNS)} FROM trainings{where} '
+            f'ORDER BY day, id', params)
+        return map(self._load, cursor)
+
+    def query_pages(self, workout_type: Optional[str] = None,
+                    size: Optional[int] = None
+                    ) -> Iterator[List[StoredTraining]]:
+        """Тренировки страницами по `size` строк в порядке `id`.
+
+        Каждая страница читается целиком отдельным запросом, поэтому
+        между страницами строки можно перезаписывать: открытой выборки
+        в это время нет.
+        """
+        size = size or self.batch_size
+        condition = '' if workout_type is None else 'workout_type = ? AND '
+        statement = (f'SELECT {", ".join(COLUMNS)} FROM trainings '
+                     f'WHERE {condition}id > ? ORDER BY id LIMIT ?')
+        last = -1
+        while True:
+            params: List[Any] = [] if workout_type is None else [
+                workout_type]
+            rows = self.connection.execute(
+                statement, params + [last, size]).fetchall()
+            if not rows:
+                return
+            yield [self._load(row) for row in rows]
+            last = rows[-1][0]
+
+    def history(self, user: str, start: Optional[Day] = None,
+                end: Optional[Day] = None,
+                workout_type: Optional[str] = None) -> List[StoredTraining]:
+        """История тренировок пользователя по дням."""
+        return list(self.query(user, start, end, workout_type))
+
+    def day_totals(self, day: Day) -> Dict[Tuple[str, str],
+                                           Tuple[int, float, float]]:
+        """Суммы за день: (пользователь, тип) -> (число, км, ккал)."""
+        cursor = self.connection.execute(
+            'SELECT user, workout_type, COUNT(*), SUM(distance), '
+            'SUM(calories) FROM trainings WHERE day = ? '
+            'GROUP BY user, workout_type', (_day(day),))
+        return {(user, workout_type): (count, distance, calories)
+                for user, workout_type, count, distance, calories in cursor}
@@ -0,0 +1,135 @@
+"""Потоковая обработка пакетов датчиков из файлов и stdin."""
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional,
+                    TextIO, Tuple)
+
+from homework import error_message, read_package
+
+Package = Tuple[str, List[float]]
+
+CHUNK_SIZE: int = 10_000
+PACKAGE_ERRORS = (ValueError, TypeError, ArithmeticError)
+
+
+def parse_csv_line(line: str) -> Package:
+    """Разобрать строку вида `RUN,15000,1,75`."""
+    workout_type, *values = line.split(',')
+    return workout_type.strip(), [float(value) for value in values]
+
+
+def parse_jsonl_line(line: str) -> Package:
+    """Разобрать строку `["RUN", [15000, 1, 75]]` или объект JSON."""
+    record = json.loads(line)
+    if isinstance(record, dict):
+        return record['workout_type'], record['data']
+    workout_type, data = record
+    return workout_type, data
+
+
+PARSERS: Dict[str, Callable[[str], Package]] = {
+    'csv': parse_csv_line,
+    'jsonl': parse_jsonl_line
+}  # формат: разбор строки
+
+
+@dataclass
+class StreamStats:
+    """Статистика потоковой обработки."""
+
+    records: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Пропускная способность в пакетах в секунду."""
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def get_message(self) -> str:
+        return (f'Обработано пакетов: {self.records}; '
+                f'ошибок: {self.errors}; '
+                f'время: {self.seconds:.3f} с; '
+                f'скорость: {self.rate:.0f} пакетов/с.')
+
+
+def process_lines(lines: Iterable[str], fmt: str = 'csv',
+                  stats: Optional[StreamStats] = None) -> Iterator[str]:
+    """Построчно превратить пакеты в сообщения о тренировках."""
+    parse = PARSERS[fmt]
+    if stats is None:
+        stats = StreamStats()
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        stats.records += 1
+        try:
+            workout_type, data = parse(line)
+        except (ValueError, KeyError, TypeError) as err:
+            stats.errors += 1
+            yield f'Строка {line_no}: не удалось разобрать пакет ({err!r})'
+            continue
+        try:
+            training = read_package(workout_type, data)
+            yield training.show_training_info().get_message()
+        except PACKAGE_ERRORS as err:
+            stats.errors += 1
+            yield error_message(err)
+
+
+def write_stream(messages: Iterable[str], output: TextIO,
+                 chunk_size: int = CHUNK_SIZE) -> None:
+    """Записывать сообщения порциями, не держа весь поток в памяти."""
+    messages = iter(messages)
+    while True:
+        chunk = list(islice(messages, chunk_size))
+        if not chunk:
+            break
+        chunk.append('')
+        output.write('\n'.join(chunk))
+
+
+def process_stream(source: TextIO, output: TextIO, fmt: str = 'csv',
+                   chunk_size: int = CHUNK_SIZE) -> StreamStats:
+    """Обработать поток пакетов и вернуть статистику."""
+    stats = StreamStats()
+    start = time.perf_counter()
+    write_stream(process_lines(source, fmt, stats), output, chunk_size)
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def detect_format(path: str) -> str:
+    """Определить формат файла по расширению."""
+    return 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Обработать файлы или stdin и вывести статистику в stderr."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('paths', nargs='*', default=['-'],
+                        help='файлы с пакетами, `-` - stdin')
+    parser.add_argument('-f', '--format', choices=sorted(PARSERS),
+                        help='формат входных данных')
+    parser.add_argument('-c', '--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='размер порции записи')
+    args = parser.parse_args(argv)
+    for path in args.paths:
+        fmt = args.format or detect_format(path)
+        if path == '-':
+            stats = process_stream(sys.stdin, sys.stdout, fmt,
+                                   args.chunk_size)
+        else:
+            with open(path, encoding='utf-8') as source:
+                stats = process_stream(source, sys.stdout, fmt,
+                                       args.chunk_size)
+        print(stats.get_message(), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
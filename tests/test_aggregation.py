@@ -0,0 +1,54 @@
+import pickle
+from datetime import date
+
+import homework
+from aggregation import Aggregator, Totals
+
+RUN = homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+SWM = homework.read_package('SWM', [720, 1, 80, 25, 40]).show_training_info()
+
+
+def test_day_and_window_totals():
+    aggregator = Aggregator()
+    for day in range(1, 11):
+        aggregator.add('ann', date(2024, 5, day), RUN)
+    aggregator.add('ann', date(2024, 5, 10), SWM)
+    aggregator.add('bob', date(2024, 5, 10), RUN)
+    day = aggregator.day_totals('ann', date(2024, 5, 10))
+    assert day.count == 2
+    assert day.calories == RUN.calories + SWM.calories
+    week = aggregator.window_totals('ann', date(2024, 5, 10), 7, 'Running')
+    assert week.count == 7
+    assert week.distance == RUN.distance * 7
+    assert aggregator.day_totals('eve', date(2024, 5, 10)) == Totals()
+
+
+def test_snapshot_merge():
+    first, second = Aggregator(), Aggregator()
+    first.add('ann', date(2024, 5, 1), RUN)
+    second.add('ann', date(2024, 5, 1), RUN)
+    second.add('ann', date(2024, 5, 2), SWM)
+    snapshot = pickle.loads(pickle.dumps(second.snapshot()))
+    first.merge(snapshot)
+    assert first.day_totals('ann', date(2024, 5, 1)).count == 2
+    merged = Aggregator.from_snapshot(first.snapshot())
+    assert merged.snapshot() == first.snapshot()
+
+
+def test_expire():
+    aggregator = Aggregator()
+    aggregator.add('ann', date(2024, 5, 1), RUN)
+    aggregator.add('bob', date(2024, 5, 3), RUN)
+    aggregator.expire(date(2024, 5, 2))
+    assert list(aggregator.users) == ['bob']
+
+
+def test_replace():
+    aggregator = Aggregator()
+    aggregator.add('ann', date(2024, 5, 1), RUN)
+    aggregator.add('ann', date(2024, 5, 1), RUN)
+    heavier = homework.read_package('RUN', [15000, 1, 80]).show_training_info()
+    aggregator.replace('ann', date(2024, 5, 1), RUN, heavier)
+    totals = aggregator.day_totals('ann', date(2024, 5, 1))
+    assert totals.count == 2
+    assert totals.calories == RUN.calories + heavier.calories
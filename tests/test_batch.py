@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+import batch
+import homework
+
+
+def random_packages(workout_type, count, seed=0):
+    rnd = random.Random(seed)
+    arity = {'SWM': 5, 'RUN': 3, 'WLK': 4}[workout_type]
+    return [[rnd.randint(1, 30000)] + [rnd.uniform(0.1, 200)
+                                       for _ in range(arity - 1)]
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_compute_batch_matches_objects(workout_type):
+    packages = random_packages(workout_type, 500)
+    columns = batch.packages_to_columns(workout_type, packages)
+    results = batch.compute_batch(workout_type, columns)
+    for i, data in enumerate(packages):
+        training = homework.read_package(workout_type, data)
+        assert results['distance'][i] == training.get_distance()
+        assert results['speed'][i] == training.get_mean_speed()
+        assert results['calories'][i] == training.get_spent_calories()
+
+
+def test_batch_training_info():
+    columns = batch.packages_to_columns('RUN', [[15000, 1, 75]])
+    [message] = batch.batch_training_info('RUN', columns)
+    expected = homework.read_package('RUN', [15000, 1, 75])
+    assert message == expected.show_training_info()
+
+
+def test_compute_batch_errors():
+    with pytest.raises(ValueError):
+        batch.compute_batch('BIK', {})
+    with pytest.raises(TypeError):
+        batch.compute_batch('RUN', {'action': [1], 'duration': [1]})
+    with pytest.raises(TypeError):
+        batch.compute_batch(
+            'RUN', {'action': [1, 2], 'duration': [1], 'weight': [1]})
+    with pytest.raises(TypeError):
+        batch.packages_to_columns('RUN', [[1, 2]])
+
+
+def test_training_array():
+    packages = random_packages('WLK', 50)
+    trainings = batch.TrainingArray('WLK', packages)
+    assert len(trainings) == 50
+    assert trainings[3] == homework.SportsWalking(*packages[3])
+    assert list(trainings)[-1] == homework.SportsWalking(*packages[-1])
+    assert trainings.show_training_info() == [
+        homework.SportsWalking(*data).show_training_info()
+        for data in packages
+    ]
+    assert trainings.get_spent_calories()[0] == (
+        homework.SportsWalking(*packages[0]).get_spent_calories())
+    with pytest.raises(TypeError):
+        trainings.append([1, 2, 3])
+
+
+def test_info_message_has_no_dict():
+    info = homework.InfoMessage('Running', 1, 2, 3, 4)
+    assert not hasattr(info, '__dict__')
+
+
+def test_training_array_bad_row_keeps_columns():
+    trainings = batch.TrainingArray('RUN', [[15000, 1, 75]])
+    with pytest.raises(TypeError):
+        trainings.append([1, 'x', 3])
+    assert {len(column) for column in trainings.columns.values()} == {1}
+    trainings.append([9000, 1, 75])
+    assert len(trainings.compute()['calories']) == 2
@@ -0,0 +1,27 @@
+import json
+
+from benchmarks import suite
+
+
+def test_find_regressions():
+    baseline = {'results': {'a@1': {'ns_per_op': 100.0},
+                            'b@1': {'ns_per_op': 100.0}}}
+    current = {'results': {'a@1': {'ns_per_op': 105.0},
+                           'b@1': {'ns_per_op': 150.0},
+                           'c@1': {'ns_per_op': 1.0}}}
+    regressions = suite.find_regressions(current, baseline, 0.1)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('b@1')
+
+
+def test_main_saves_and_compares(tmp_path):
+    path = tmp_path / 'baseline.json'
+    args = ['--sizes', '100', '--repeat', '1',
+            '--only', 'InfoMessage.get_message']
+    assert suite.main(args + ['--save', str(path)]) == 0
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    assert list(saved['results']) == ['InfoMessage.get_message@100']
+    for result in saved['results'].values():
+        result['ns_per_op'] /= 1000
+    path.write_text(json.dumps(saved), encoding='utf-8')
+    assert suite.main(args + ['--baseline', str(path)]) == 1
@@ -0,0 +1,59 @@
+import pytest
+
+import homework
+from cache import PackageCache
+
+
+def test_hits_and_misses():
+    cache = PackageCache()
+    first = cache.get_info('RUN', [15000, 1, 75])
+    second = cache.get_info('RUN', [15000.0, 1.0, 75.0])
+    assert second is first
+    assert first == homework.read_package(
+        'RUN', [15000, 1, 75]).show_training_info()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_lru_eviction_by_entries():
+    cache = PackageCache(max_entries=2)
+    cache.get_info('RUN', [1, 1, 1])
+    cache.get_info('RUN', [2, 1, 1])
+    cache.get_info('RUN', [1, 1, 1])
+    cache.get_info('RUN', [3, 1, 1])
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    cache.get_info('RUN', [1, 1, 1])
+    assert cache.stats.hits == 2
+
+
+def test_eviction_by_memory():
+    cache = PackageCache(max_bytes=1000)
+    for action in range(100):
+        cache.get_info('SWM', [action, 1, 80, 25, 40])
+    assert 0 < cache.bytes <= 1000
+    assert len(cache) < 100
+
+
+def test_errors_are_not_cached():
+    cache = PackageCache()
+    with pytest.raises(ValueError):
+        cache.get_info('BIK', [1, 2, 3])
+    with pytest.raises(TypeError):
+        cache.get_info('RUN', [1, 2])
+    assert len(cache) == 0
+
+
+def test_get_message_rendered_once():
+    cache = PackageCache()
+    message = cache.get_message('WLK', [9000, 1, 75, 180])
+    assert message == homework.read_package(
+        'WLK', [9000, 1, 75, 180]).show_training_info().get_message()
+    assert cache.get_message('WLK', [9000, 1, 75, 180]) is message
+
+
+def test_unhashable_package_bypasses_cache():
+    cache = PackageCache()
+    with pytest.raises(TypeError):
+        cache.get_info('RUN', [[1], 1, 1])
+    assert len(cache) == 0
@@ -0,0 +1,59 @@
+import io
+import subprocess
+import sys
+
+import cli
+from conftest import BASE_DIR
+
+RUNNING = ('Тип тренировки: Running; Длительность: 1.000 ч.; '
+           'Дистанция: 9.750 км; Ср. скорость: 9.750 км/ч; '
+           'Потрачено ккал: 699.750.')
+
+
+def test_process_lines():
+    output = io.StringIO()
+    errors = cli.process_lines(['RUN,15000,1,75\n', 'BIK,1\n', 'RUN,1,0,1'],
+                               output)
+    assert errors == 2
+    lines = output.getvalue().splitlines()
+    assert lines[:2] == [RUNNING,
+                         'Проверьте правильность типа тренировки BIK']
+
+
+def test_worker_answers_each_batch():
+    source = io.StringIO('RUN,15000,1,75\n\nRUN,15000,1,75\nBIK,1\n\n')
+    output = io.StringIO()
+    cli.run_worker(source, output)
+    assert output.getvalue().split('\n\n') == [
+        RUNNING,
+        RUNNING + '\nПроверьте правильность типа тренировки BIK',
+        ''
+    ]
+
+
+def test_startup_does_not_import_heavy_modules():
+    code = ('import sys, cli; '
+            'print(sorted({"homework", "json", "argparse", "asyncio"} '
+            '& set(sys.modules)))')
+    result = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_process_lines_reports_bad_numbers():
+    output = io.StringIO()
+    errors = cli.process_lines(['RUN,x,1,75\n', 'RUN,15000,1,75\n'], output)
+    assert errors == 1
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith('Строка 1: не удалось разобрать пакет')
+    assert 'тип' not in lines[0]
+    assert lines[1] == RUNNING
+
+
+def test_main_counts_blank_lines(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'stdin',
+                        io.StringIO('RUN,15000,1,75\n\nRUN,x,1,75\n'))
+    assert cli.main([]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == RUNNING
+    assert lines[1].startswith('Строка 3: не удалось разобрать пакет')
@@ -0,0 +1,52 @@
+import pytest
+
+import batch
+import columnar
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+]
+
+
+def test_roundtrip(tmp_path):
+    path = str(tmp_path / 'day.ftrk')
+    columnar.write_packages(path, PACKAGES)
+    with columnar.ColumnarFile(path) as file:
+        assert len(file) == 4
+        assert list(file.sections['RUN']['action']) == [15000, 1206]
+        assert file.compute()['RUN'] == batch.compute_batch(
+            'RUN', {'action': [15000, 1206], 'duration': [1, 12],
+                    'weight': [75, 6]})
+        infos = file.show_training_info()
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    assert sorted(infos, key=repr) == sorted(expected, key=repr)
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / 'broken.ftrk'
+    path.write_bytes(b'NOPE' + bytes(4))
+    with pytest.raises(ValueError):
+        columnar.ColumnarFile(str(path))
+
+
+def test_truncated(tmp_path):
+    path = tmp_path / 'day.ftrk'
+    columnar.write_packages(str(path), PACKAGES)
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        columnar.ColumnarFile(str(path))
+
+
+@pytest.mark.parametrize('code', ['CYCLE', 'ВЕЛ'])
+def test_code_must_fit_header(tmp_path, monkeypatch, code):
+    monkeypatch.setitem(homework.WORKOUT_TYPES, code, homework.Running)
+    monkeypatch.setitem(homework.WORKOUT_ARITY, code, 3)
+    path = tmp_path / 'day.ftrk'
+    with pytest.raises(ValueError, match='ASCII'):
+        columnar.write_packages(str(path), PACKAGES + [(code, [1, 1, 1])])
+    assert not path.exists()
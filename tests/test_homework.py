@@ -1,4 +1,5 @@
 import re
+from dataclasses import dataclass
 import pytest
 import types
 import inspect
@@ -363,3 +364,125 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_get_metrics(input_data):
+    training = homework.read_package(*input_data)
+    metrics = training.get_metrics()
+    assert metrics == (
+        training.get_distance(),
+        training.get_mean_speed(),
+        training.get_spent_calories()
+    ), 'Показатели `get_metrics` должны совпадать с методами тренировки.'
+    assert training.get_metrics() is metrics, (
+        'Метод `get_metrics` должен запоминать результат.'
+    )
+    training.weight += 1
+    assert training.get_metrics().calories == (
+        training.get_spent_calories()
+    ), 'После изменения полей показатели нужно пересчитать.'
+
+
+def test_get_metrics_computes_once(monkeypatch):
+    training = homework.Running(15000, 1, 75)
+    calls = []
+    get_distance = training.get_distance
+
+    def counting_get_distance():
+        calls.append(1)
+        return get_distance()
+    monkeypatch.setattr(training, 'get_distance', counting_get_distance)
+    metrics = training.get_metrics()
+    count = len(calls)
+    assert training.get_metrics() is metrics
+    assert len(calls) == count, (
+        'Повторный `get_metrics` не должен пересчитывать показатели.'
+    )
+
+
+@pytest.mark.parametrize('template', [
+    homework.InfoMessage.MESSAGE,
+    '{training_type} 100% {calories:>12.2f}',
+    '{training_type!r}: {speed}',
+    'без полей',
+    '{duration:+.1e}',
+    '{speed:.3}',
+    '{training_type:10}|',
+    '{calories:-10.1f}|',
+    '{calories:,.2f}',
+    '{calories:#010.2g}',
+])
+def test_compile_message(template):
+    info_message = homework.InfoMessage('Running', 1, 9.75, 9.75, 699.75)
+    render = homework.compile_message(template)
+    assert render(info_message) == template.format(
+        training_type='Running', duration=1, distance=9.75,
+        speed=9.75, calories=699.75
+    ), 'Быстрая отрисовка должна совпадать со `str.format`.'
+
+
+def test_compile_message_errors_match_format():
+    info_message = homework.InfoMessage('Running', 1, 9.75, 9.75, 699.75)
+    for template in ('{calories:d}', '{speed:s}', '{training_type:.2f}'):
+        with pytest.raises(ValueError):
+            template.format(training_type='Running', speed=9.75,
+                            calories=699.75)
+        with pytest.raises(ValueError):
+            homework.compile_message(template)(info_message)
+
+
+def test_write_messages():
+    messages = [
+        homework.read_package('RUN', [15000, 1, 75]).show_training_info(),
+        homework.read_package('SWM', [720, 1, 80, 25, 40]).show_training_info()
+    ]
+    with Capturing() as output:
+        homework.write_messages(messages)
+    assert output == [message.get_message() for message in messages]
+
+
+def test_register_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, 'WORKOUT_ARITY',
+                        dict(homework.WORKOUT_ARITY))
+
+    @homework.register_workout('BIK')
+    @dataclass
+    class Cycling(homework.Training):
+        LEN_STEP = 5.0
+
+        def get_spent_calories(self):
+            return self.get_mean_speed() * self.weight
+
+    training = homework.read_package('BIK', [1000, 1, 70])
+    assert isinstance(training, Cycling), (
+        'Функция `read_package` должна знать зарегистрированные классы.'
+    )
+    assert training.show_training_info().calories == 350.0
+    with pytest.raises(TypeError):
+        homework.read_package('BIK', [1000, 1])
+
+
+def test_public_overrides_are_respected():
+    class Fixed(homework.Running):
+        def get_mean_speed(self):
+            return 42
+
+    class Flat(homework.Running):
+        def get_spent_calories(self):
+            return 7
+
+    fixed = Fixed(15000, 1, 75)
+    info = fixed.show_training_info()
+    assert info.speed == 42, (
+        'Переопределённый `get_mean_speed` должен попадать в сообщение.'
+    )
+    assert info.calories == fixed.get_spent_calories()
+    assert fixed.get_metrics().speed == 42
+    assert Flat(15000, 1, 75).show_training_info().calories == 7
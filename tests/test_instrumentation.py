@@ -0,0 +1,98 @@
+import json
+from dataclasses import dataclass
+
+import pytest
+
+import homework
+import streaming
+from instrumentation import Instrumentation
+
+
+def run_pipeline():
+    for package in [('RUN', [15000, 1, 75]), ('WLK', [9000, 1, 75, 180])]:
+        homework.read_package(*package).show_training_info().get_message()
+
+
+def test_collects_stages_per_type():
+    with Instrumentation() as instrumentation:
+        run_pipeline()
+        list(streaming.process_lines(['SWM,720,1,80,25,40']))
+    counts = {key: histogram.count
+              for key, histogram in instrumentation.histograms.items()}
+    assert counts[('read_package', 'RUN')] == 1
+    assert counts[('read_package', 'SWM')] == 1
+    assert counts[('calories', 'SportsWalking')] == 1
+    assert counts[('show_training_info', 'Running')] == 1
+    assert counts[('get_message', 'Swimming')] == 1
+
+
+def test_disable_restores_originals():
+    read_package = homework.read_package
+    show_training_info = homework.Training.show_training_info
+    spent_calories = vars(homework.Running)['get_spent_calories']
+    with Instrumentation():
+        assert homework.read_package is not read_package
+        assert streaming.read_package is not read_package
+    assert homework.read_package is read_package
+    assert streaming.read_package is read_package
+    assert homework.Training.show_training_info is show_training_info
+    assert vars(homework.Running)['get_spent_calories'] is spent_calories
+    instrumentation = Instrumentation()
+    run_pipeline()
+    assert instrumentation.histograms == {}
+
+
+def test_export(tmp_path):
+    with Instrumentation() as instrumentation:
+        run_pipeline()
+    text = instrumentation.to_prometheus()
+    assert ('fitness_stage_seconds_count{stage="get_message",'
+            'workout="Running"} 1') in text
+    assert 'le="+Inf"} 1' in text
+    path = tmp_path / 'metrics.json'
+    instrumentation.write(str(path))
+    metrics = json.loads(path.read_text(encoding='utf-8'))
+    assert metrics['read_package/WLK']['count'] == 1
+
+
+def test_unknown_types_share_label():
+    instrumentation = Instrumentation()
+    with instrumentation:
+        for workout_type in ['BIK', 'X"1\n', ['RUN']]:
+            try:
+                homework.read_package(workout_type, [1])
+            except (ValueError, TypeError):
+                pass
+    assert set(instrumentation.histograms) == {('read_package', 'unknown')}
+    instrumentation.observe('read_package', 'a"b\\c\nd', 1e-6)
+    text = instrumentation.to_prometheus()
+    assert 'workout="a\\"b\\\\c\\nd"' in text
+    assert all(line.startswith(('#', 'fitness_stage_seconds'))
+               for line in text.splitlines())
+
+
+def test_inherited_calories_are_not_patched(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, 'WORKOUT_ARITY',
+                        dict(homework.WORKOUT_ARITY))
+
+    @homework.register_workout('YOG')
+    @dataclass
+    class Yoga(homework.Training):
+        pass
+
+    @homework.register_workout('TRL')
+    @dataclass
+    class TrailRunning(homework.Running):
+        pass
+
+    monkeypatch.setattr('instrumentation.WORKOUT_TYPES',
+                        homework.WORKOUT_TYPES)
+    with Instrumentation() as instrumentation:
+        assert 'get_spent_calories' not in vars(Yoga)
+        with pytest.raises(NotImplementedError):
+            Yoga(1000, 1, 70).get_spent_calories()
+        TrailRunning(15000, 1, 75).show_training_info()
+    assert instrumentation.histograms[
+        ('calories', 'TrailRunning')].count == 1
@@ -0,0 +1,76 @@
+import json
+import pickle
+
+import pytest
+
+import batch
+import homework
+import models
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / 'models.json'
+    path.write_text(json.dumps({
+        'test-a': {'RUN': {'RUN_SPEED_COEFF1': 17.5},
+                   'SWM': {'ADD_SPEED': 1.2}},
+    }), encoding='utf-8')
+    [loaded] = models.load_models(str(path))
+    yield loaded
+    del models.MODELS['test-a']
+
+
+def test_compiled_classes(model):
+    running = model.classes['RUN']
+    assert running is not homework.Running
+    assert issubclass(running, homework.Running)
+    assert running.__name__ == 'Running'
+    assert running.RUN_SPEED_COEFF1 == 17.5
+    assert homework.Running.RUN_SPEED_COEFF1 == 18
+    assert model.classes['WLK'] is homework.SportsWalking
+
+
+def test_model_matches_constants(model):
+    training = model.read_package('RUN', [15000, 1, 75])
+    info = training.show_training_info()
+    assert info.training_type == 'Running'
+    expected = ((17.5 * training.get_mean_speed() - 20) * 75 / 1000 * 60)
+    assert info.calories == pytest.approx(expected)
+    columns = batch.packages_to_columns('RUN', [[15000, 1, 75]])
+    assert model.compute_batch('RUN', columns)['calories'] == [
+        training.get_spent_calories()]
+
+
+def test_compare_models(model):
+    packages = [('RUN', [15000, 1, 75]), ('SWM', [720, 1, 80, 25, 40]),
+                ('RUN', [9000, 2, 60])]
+    results = models.compare_models(packages, ['default', 'test-a'])
+    assert set(results) == {'default', 'test-a'}
+    default = homework.read_package('SWM', [720, 1, 80, 25, 40])
+    assert results['default']['SWM']['calories'] == [
+        default.get_spent_calories()]
+    assert results['test-a']['SWM']['calories'] == [
+        model.read_package('SWM', [720, 1, 80, 25, 40])
+        .get_spent_calories()]
+    assert len(results['test-a']['RUN']['calories']) == 2
+
+
+def test_bad_config():
+    with pytest.raises(ValueError):
+        models.CalorieModel('bad', {'RUN': {'ADD_SPEED': 1}})
+    with pytest.raises(ValueError):
+        models.CalorieModel('bad', {'BIK': {}})
+    with pytest.raises(TypeError):
+        models.CalorieModel('bad', {'RUN': {'RUN_SPEED_COEFF1': 'x'}})
+    with pytest.raises(TypeError):
+        models.MODELS['default'].read_package('RUN', [1, 2])
+
+
+def test_compiled_training_pickles(model):
+    training = model.read_package('RUN', [15000, 1, 75])
+    restored = pickle.loads(pickle.dumps(training))
+    assert type(restored) is model.classes['RUN']
+    assert restored == training
+    assert restored.show_training_info() == training.show_training_info()
+    assert models.compile_class(homework.Running, {
+        'RUN_SPEED_COEFF1': 17.5}) is model.classes['RUN']
@@ -0,0 +1,61 @@
+import pytest
+
+import homework
+import parallel
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('BIK', [1, 2, 3]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1, 2]),
+    ('RUN', [15000, 0, 75]),
+] * 10
+
+
+def expected_infos():
+    infos = []
+    for workout_type, data in PACKAGES:
+        try:
+            infos.append(
+                homework.read_package(workout_type, data).show_training_info()
+            )
+        except (ValueError, TypeError, ZeroDivisionError):
+            infos.append(None)
+    return infos
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_process_parallel_ordered(workers):
+    result = parallel.process_parallel(PACKAGES, workers, chunk_size=4)
+    assert result.infos == expected_infos()
+    assert [error.index for error in result.errors] == [
+        index for index, info in enumerate(expected_infos()) if info is None
+    ]
+    assert result.errors[0] == parallel.PackageError(
+        2, 'BIK', 'Проверьте правильность типа тренировки BIK')
+
+
+def test_process_parallel_unordered():
+    result = parallel.process_parallel(
+        PACKAGES, workers=2, chunk_size=4, ordered=False)
+    expected = [info for info in expected_infos() if info is not None]
+    assert sorted(result.infos, key=repr) == sorted(expected, key=repr)
+    assert len(result.errors) == 30
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_iter_parallel_reads_lazily(ordered):
+    consumed = []
+
+    def packages():
+        for index in range(10_000):
+            consumed.append(index)
+            yield 'RUN', [15000, 1, 75]
+
+    results = parallel.iter_parallel(packages(), 2, chunk_size=10,
+                                     ordered=ordered)
+    next(results)
+    window = parallel.WINDOW_PER_WORKER * 2
+    assert len(consumed) <= (window + 1) * 10
+    assert sum(len(chunk.infos) for chunk in results) == 10_000 - 10
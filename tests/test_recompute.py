@@ -0,0 +1,96 @@
+from datetime import date
+
+import pytest
+
+import homework
+import recompute
+import store
+
+RECORDS = [
+    ('ann', date(2024, 5, 1), 'RUN', [15000, 1, 75]),
+    ('ann', date(2024, 5, 2), 'WLK', [9000, 1, 75, 180]),
+    ('ann', date(2024, 5, 3), 'SWM', [720, 1, 75, 25, 40]),
+    ('bob', date(2024, 5, 2), 'SWM', [720, 1, 80, 25, 40]),
+    ('bob', date(2024, 5, 3), 'RUN', [9000, 2, 80]),
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    with store.TrainingStore(str(tmp_path / 'trainings.db'),
+                             batch_size=1) as opened:
+        opened.add_many(RECORDS)
+        yield recompute.RecomputeEngine(
+            opened, aggregator=recompute.rebuild_aggregator(opened))
+
+
+def assert_consistent(engine):
+    rebuilt = recompute.rebuild_aggregator(engine.store).snapshot()
+    snapshot = engine.aggregator.snapshot()
+    assert rebuilt.keys() == snapshot.keys()
+    for key, values in rebuilt.items():
+        assert snapshot[key] == pytest.approx(values)
+
+
+def test_dependents():
+    assert recompute.field_dependents('height') == ['WLK']
+    assert sorted(recompute.field_dependents('weight')) == [
+        'RUN', 'SWM', 'WLK']
+    model = recompute.MODELS['default']
+    assert recompute.constant_dependents(
+        model, {'SWM': {'ADD_SPEED': 1.1}}) == []
+    assert recompute.constant_dependents(
+        model, {'SWM': {'ADD_SPEED': 1.2}, 'RUN': {}}) == ['SWM']
+
+
+def test_user_weight(engine):
+    change = engine.set_user_field('ann', 'weight', 80,
+                                   start=date(2024, 5, 2))
+    assert change.rows == 2
+    history = engine.store.history('ann')
+    assert [row.data[2] for row in history] == [75, 80, 80]
+    walking = homework.SportsWalking(9000, 1, 80, 180)
+    assert history[1].info == walking.show_training_info()
+    assert engine.store.history('bob')[0].data[2] == 80
+    assert engine.set_user_field('bob', 'weight', 80).rows == 0
+    assert_consistent(engine)
+    with pytest.raises(ValueError):
+        engine.set_user_field('ann', 'age', 30)
+    for name in ('action', 'duration', 'length_pool'):
+        with pytest.raises(ValueError):
+            engine.set_user_field('ann', name, 1)
+
+
+def test_user_height(engine):
+    change = engine.set_user_field('ann', 'height', 170)
+    assert change.rows == 1
+    walking = homework.SportsWalking(9000, 1, 75, 170)
+    assert change.calories_delta == pytest.approx(
+        walking.get_spent_calories()
+        - homework.SportsWalking(9000, 1, 75, 180).get_spent_calories())
+
+
+def test_constants(engine):
+    change = engine.set_constants({'SWM': {'ADD_SPEED': 1.2}})
+    assert change.rows == 2
+    swimming = engine.model.read_package('SWM', [720, 1, 80, 25, 40])
+    assert engine.store.history('bob')[0].info == (
+        swimming.show_training_info())
+    assert engine.store.history('bob')[1].info == homework.read_package(
+        'RUN', [9000, 2, 80]).show_training_info()
+    assert engine.set_constants({'SWM': {'ADD_SPEED': 1.2}}).rows == 0
+    assert engine.model.classes['SWM'].ADD_SPEED == 1.2
+    assert homework.Swimming.ADD_SPEED == 1.1
+    assert_consistent(engine)
+
+
+def test_constants_read_pages_before_writing(engine):
+    engine.store.add_many([('cid', date(2024, 6, day), 'SWM',
+                            [720, 1, 70, 25, 40]) for day in range(1, 6)])
+    engine.aggregator = recompute.rebuild_aggregator(engine.store)
+    pages = list(engine.store.query_pages('SWM', 3))
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert all(isinstance(page, list) for page in pages)
+    change = engine.set_constants({'SWM': {'ADD_SPEED': 1.2}})
+    assert change.rows == 7
+    assert_consistent(engine)
@@ -0,0 +1,97 @@
+import gzip
+import os
+
+import pytest
+
+import homework
+import reports
+
+RUN = homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+SWM = homework.read_package('SWM', [720, 1, 80, 25, 40]).show_training_info()
+
+
+def test_writer_buffers_and_shards(tmp_path):
+    writer = reports.ShardedReportWriter(str(tmp_path), buffer_lines=10**6)
+    writer.write('alice', RUN)
+    writer.write_many('bob', [SWM, RUN])
+    assert os.listdir(tmp_path) == []
+    writer.close()
+    assert sorted(os.listdir(tmp_path)) == ['alice.txt', 'bob.txt']
+    assert (tmp_path / 'bob.txt').read_text(encoding='utf-8') == (
+        f'{SWM.get_message()}\n{RUN.get_message()}\n')
+    assert writer.lines == 3
+
+
+def test_writer_flushes_full_buffer(tmp_path):
+    writer = reports.ShardedReportWriter(str(tmp_path), worker=1,
+                                         buffer_lines=1)
+    writer.write('2024-01-01', RUN)
+    path = tmp_path / '2024-01-01.1.txt'
+    assert path.read_text(encoding='utf-8') == RUN.get_message() + '\n'
+    assert list(writer.paths()) == [str(path)]
+
+
+def test_writer_compress(tmp_path):
+    with reports.ShardedReportWriter(str(tmp_path), compress=True,
+                                     buffer_lines=1) as writer:
+        writer.write('alice', RUN)
+        writer.write('alice', SWM)
+    with gzip.open(tmp_path / 'alice.txt.gz', 'rt', encoding='utf-8') as f:
+        assert f.read().splitlines() == [RUN.get_message(),
+                                         SWM.get_message()]
+
+
+def test_bad_shard_name(tmp_path):
+    writer = reports.ShardedReportWriter(str(tmp_path))
+    with pytest.raises(ValueError):
+        writer.write('../etc', RUN)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_write_reports(tmp_path, workers):
+    records = [(f'user{index % 3}', 'RUN', [15000, 1, 75])
+               for index in range(30)]
+    records.append(('user0', 'BIK', [1]))
+    result = reports.write_reports(records, str(tmp_path), workers,
+                                   chunk_size=7)
+    assert result.lines == 30
+    assert [error.index for error in result.errors] == [30]
+    lines = [line for name in os.listdir(tmp_path)
+             if name.startswith('user1.')
+             for line in (tmp_path / name).read_text(
+                 encoding='utf-8').splitlines()]
+    assert lines == [RUN.get_message()] * 10
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_write_reports_bad_shard(tmp_path, workers):
+    records = [('user0', 'RUN', [15000, 1, 75]),
+               ('../user1', 'RUN', [15000, 1, 75]),
+               ('user0', 'RUN', [15000, 1, 75]),
+               ('a\0b', 'RUN', [15000, 1, 75]),
+               (42, 'RUN', [15000, 1, 75])]
+    result = reports.write_reports(records, str(tmp_path / 'out'), workers)
+    assert result.lines == 2
+    assert [error.index for error in result.errors] == [1, 3, 4]
+    assert result.errors[0].message == (
+        "Недопустимое имя раздела: '../user1'.")
+    assert all('раздел' in error.message
+               and 'тип тренировки' not in error.message
+               for error in result.errors)
+    assert not (tmp_path / 'user1.txt').exists()
+
+
+def test_write_reports_reads_lazily(tmp_path):
+    consumed = []
+
+    def records():
+        for index in range(1000):
+            consumed.append(index)
+            yield 'user0', 'RUN', [15000, 1, 75]
+
+    tasks = ((str(tmp_path), False, start, chunk)
+             for start, chunk in reports.iter_chunks(records(), 10))
+    written = reports._iter_written(tasks, 2)
+    next(written)
+    assert len(consumed) <= (reports.WINDOW_PER_WORKER * 2 + 1) * 10
+    assert sum(chunk.lines for chunk in written) == 1000 - 10
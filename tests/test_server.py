@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+import server
+
+
+async def exchange(requests, **options):
+    training_server = server.TrainingServer(**options)
+    await training_server.start()
+    reader, writer = await asyncio.open_connection(
+        '127.0.0.1', training_server.port)
+    for request in requests:
+        writer.write(request.encode() + b'\n')
+    await writer.drain()
+    writer.write_eof()
+    replies = [json.loads(line) async for line in reader]
+    writer.close()
+    await training_server.close()
+    return replies, training_server
+
+
+def test_server_replies_in_order():
+    requests = [
+        json.dumps({'id': 1, 'workout_type': 'RUN', 'data': [15000, 1, 75]}),
+        json.dumps({'id': 2, 'workout_type': 'BIK', 'data': [1, 2, 3]}),
+        'не json',
+        json.dumps({'id': 4, 'workout_type': 'SWM',
+                    'data': [720, 1, 80, 25, 40]}),
+    ]
+    replies, _ = asyncio.run(exchange(requests))
+    assert [reply['id'] for reply in replies] == [1, 2, None, 4]
+    assert replies[0]['message'].startswith('Тип тренировки: Running;')
+    assert replies[1]['error'] == 'Проверьте правильность типа тренировки BIK'
+    assert replies[2]['error'].startswith('Некорректный запрос')
+    assert 'Swimming' in replies[3]['message']
+
+
+def test_server_batches_requests():
+    requests = [json.dumps({'id': i, 'workout_type': 'RUN',
+                            'data': [15000, 1, 75]}) for i in range(200)]
+    replies, training_server = asyncio.run(
+        exchange(requests, max_batch=50, connection_limit=8, queue_size=16))
+    assert [reply['id'] for reply in replies] == list(range(200))
+    assert training_server.requests == 200
+    assert training_server.batches < 200
+
+
+def test_server_rejects_long_line():
+    requests = [
+        json.dumps({'id': 1, 'workout_type': 'RUN', 'data': [15000, 1, 75]}),
+        json.dumps({'id': 2, 'workout_type': 'RUN',
+                    'data': [15000, 1, 75], 'pad': 'x' * 5000}),
+        json.dumps({'id': 3, 'workout_type': 'RUN', 'data': [15000, 1, 75]}),
+    ]
+    replies, _ = asyncio.run(exchange(requests, line_limit=1024))
+    assert [reply['id'] for reply in replies] == [1, None, 3]
+    assert 'длиннее 1024 байт' in replies[1]['error']
+    assert replies[2]['message'].startswith('Тип тренировки: Running;')
@@ -0,0 +1,135 @@
+import math
+import pickle
+import random
+
+import pytest
+
+import homework
+import stats
+
+
+def test_top_n():
+    top = stats.TopN(3)
+    values = list(range(100))
+    random.Random(0).shuffle(values)
+    for value in values:
+        top.push(value, f'user{value}')
+    assert top.items() == [(99, 'user99'), (98, 'user98'), (97, 'user97')]
+    other = stats.TopN(3)
+    other.push(1000, 'best')
+    top.merge(other)
+    assert top.items()[0] == (1000, 'best')
+    assert len(top) == 3
+
+
+def test_heavy_hitters():
+    rnd = random.Random(4)
+    stream = [(f'heavy{index}', 50.0) for index in range(5)] * 40
+    stream += [(f'user{rnd.randrange(5000)}', rnd.uniform(0, 10))
+               for _ in range(20000)]
+    rnd.shuffle(stream)
+    exact = {}
+    whole = stats.HeavyHitters(100)
+    parts = [stats.HeavyHitters(100), stats.HeavyHitters(100)]
+    for index, (user, weight) in enumerate(stream):
+        exact[user] = exact.get(user, 0) + weight
+        whole.add(user, weight)
+        parts[index % 2].add(user, weight)
+    parts[0].merge(parts[1])
+    total = sum(exact.values())
+    for summary in (whole, parts[0]):
+        assert len(summary) <= 100
+        assert 0 < summary.offset <= 2 * total / 100
+        assert {user for _, user in summary.items(5)} == {
+            f'heavy{index}' for index in range(5)}
+        for user, count in exact.items():
+            estimate = summary.estimate(user)
+            assert count - 1e-6 <= estimate <= count + summary.offset + 1e-6
+    with pytest.raises(ValueError):
+        whole.add('user', -1)
+
+
+@pytest.mark.parametrize('accuracy', [0.01, 0.05])
+def test_sketch_accuracy(accuracy):
+    rnd = random.Random(1)
+    values = [rnd.lognormvariate(2, 1) for _ in range(20000)]
+    sketch = stats.QuantileSketch(accuracy)
+    for value in values:
+        sketch.add(value)
+    values.sort()
+    for q in (0, 0.5, 0.9, 0.99, 1):
+        exact = values[math.floor(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=accuracy)
+    assert len(sketch.buckets) < 1000
+
+
+def test_sketch_merge():
+    rnd = random.Random(2)
+    values = [rnd.uniform(0, 30) for _ in range(5000)] + [0.0] * 10
+    whole = stats.QuantileSketch()
+    parts = [stats.QuantileSketch(), stats.QuantileSketch()]
+    for index, value in enumerate(values):
+        whole.add(value)
+        parts[index % 2].add(value)
+    parts[0].merge(parts[1])
+    assert parts[0] == whole
+    assert math.isnan(stats.QuantileSketch().quantile(0.5))
+    with pytest.raises(ValueError):
+        whole.merge(stats.QuantileSketch(0.05))
+    with pytest.raises(ValueError):
+        whole.quantile(2)
+
+
+def test_training_stats_merge():
+    rnd = random.Random(3)
+    results = []
+    for index in range(300):
+        workout_type, data = rnd.choice([
+            ('RUN', [rnd.randint(1000, 20000), rnd.uniform(0.5, 2), 75]),
+            ('WLK', [rnd.randint(1000, 20000), rnd.uniform(0.5, 2), 75,
+                     180]),
+        ])
+        info = homework.read_package(workout_type, data).show_training_info()
+        results.append((f'user{index}', info))
+    whole = stats.TrainingStats(top=5)
+    whole.add_many(results)
+    first, second = stats.TrainingStats(top=5), stats.TrainingStats(top=5)
+    first.add_many(results[:150])
+    second.add_many(results[150:])
+    first = pickle.loads(pickle.dumps(first))
+    first.merge(second)
+    expected = sorted(((info.calories, user) for user, info in results),
+                      reverse=True)[:5]
+    assert whole.top() == first.top() == expected
+    assert whole.top('distance', 'Running') == first.top('distance',
+                                                         'Running')
+    assert whole.quantiles('Running') == first.quantiles('Running')
+    assert math.isnan(whole.quantiles('Swimming')[0.5])
+    with pytest.raises(ValueError):
+        whole.top('speed')
+
+
+def test_training_stats_top_users():
+    rnd = random.Random(5)
+    results = []
+    for index in range(400):
+        data = [rnd.randint(1000, 20000), rnd.uniform(0.5, 2), 75, 180]
+        info = homework.read_package('WLK', data).show_training_info()
+        results.append((f'user{index % 30}', info))
+    sums = {}
+    for user, info in results:
+        sums[user] = sums.get(user, 0) + info.distance
+    expected = sorted(((total, user) for user, total in sums.items()),
+                      reverse=True)[:5]
+    first, second = stats.TrainingStats(top=5), stats.TrainingStats(top=5)
+    first.add_many(results[:200])
+    second.add_many(results[200:])
+    first = pickle.loads(pickle.dumps(first))
+    first.merge(second)
+    top = first.top_users('distance')
+    assert [user for _, user in top] == [user for _, user in expected]
+    assert [total for total, _ in top] == pytest.approx(
+        [total for total, _ in expected])
+    assert len(first.top_users()) == 5
+    with pytest.raises(ValueError):
+        first.top_users('speed')
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+
+import homework
+import store
+
+RECORDS = [
+    ('ann', date(2024, 5, 1), 'RUN', [15000, 1, 75]),
+    ('ann', date(2024, 5, 2), 'SWM', [720, 1, 80, 25, 40]),
+    ('bob', date(2024, 5, 2), 'WLK', [9000, 1, 75, 180]),
+    ('ann', '2024-05-03', 'RUN', [9000, 2, 75]),
+]
+
+
+@pytest.fixture
+def training_store(tmp_path):
+    with store.TrainingStore(str(tmp_path / 'trainings.db'),
+                             batch_size=2) as opened:
+        yield opened
+
+
+def test_add_and_history(training_store):
+    assert training_store.add_many(RECORDS) == 4
+    assert len(training_store) == 4
+    history = training_store.history('ann')
+    assert [row.day for row in history] == [
+        date(2024, 5, 1), date(2024, 5, 2), date(2024, 5, 3)]
+    swimming = history[1]
+    assert swimming.workout_type == 'SWM'
+    assert swimming.data == (720, 1, 80, 25, 40)
+    assert swimming.training == homework.Swimming(720, 1, 80, 25, 40)
+    assert swimming.info == swimming.training.show_training_info()
+
+
+def test_query_filters(training_store):
+    training_store.add_many(RECORDS)
+    rows = training_store.history('ann', start='2024-05-02',
+                                  end=date(2024, 5, 3),
+                                  workout_type='RUN')
+    assert [row.data for row in rows] == [(9000, 2, 75)]
+    assert [row.user for row in training_store.query(
+        start=date(2024, 5, 2), end=date(2024, 5, 2))] == ['ann', 'bob']
+    totals = training_store.day_totals(date(2024, 5, 2))
+    walking = homework.SportsWalking(9000, 1, 75, 180)
+    assert totals[('bob', 'WLK')] == (1, walking.get_distance(),
+                                      walking.get_spent_calories())
+
+
+def test_wal_and_indexes(training_store):
+    connection = training_store.connection
+    assert connection.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+    plan = connection.execute(
+        'EXPLAIN QUERY PLAN SELECT * FROM trainings '
+        'WHERE user = ? AND day >= ?', ('ann', '2024-05-01')).fetchall()
+    assert 'trainings_user_day' in str(plan)
+
+
+def test_bad_package_keeps_previous_batches(training_store):
+    with pytest.raises(ValueError):
+        training_store.add_many(RECORDS[:2] + [('ann', date(2024, 5, 4),
+                                               'BIK', [1])])
+    assert len(training_store) == 2
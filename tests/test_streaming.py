@@ -0,0 +1,50 @@
+import io
+
+import streaming
+from conftest import Capturing
+
+SWIMMING = ('Тип тренировки: Swimming; Длительность: 1.000 ч.; '
+            'Дистанция: 0.994 км; Ср. скорость: 1.000 км/ч; '
+            'Потрачено ккал: 336.000.')
+RUNNING = ('Тип тренировки: Running; Длительность: 1.000 ч.; '
+           'Дистанция: 9.750 км; Ср. скорость: 9.750 км/ч; '
+           'Потрачено ккал: 699.750.')
+
+
+def test_process_stream_csv():
+    source = io.StringIO('SWM,720,1,80,25,40\n\nRUN,15000,1,75\n'
+                         'BIK,1,2,3\nRUN,1,2\nRUN,1,0,75\nRUN,x,1,1\n')
+    output = io.StringIO()
+    stats = streaming.process_stream(source, output, chunk_size=2)
+    lines = output.getvalue().splitlines()
+    assert lines[:3] == [
+        SWIMMING, RUNNING, 'Проверьте правильность типа тренировки BIK'
+    ]
+    assert lines[3].startswith('В данных тренировки RUN')
+    assert lines[5].startswith('Строка 7')
+    assert len(lines) == 6
+    assert (stats.records, stats.errors) == (6, 4)
+
+
+def test_process_stream_jsonl():
+    source = io.StringIO('["SWM", [720, 1, 80, 25, 40]]\n'
+                         '{"workout_type": "RUN", "data": [15000, 1, 75]}\n')
+    output = io.StringIO()
+    streaming.process_stream(source, output, fmt='jsonl')
+    assert output.getvalue().splitlines() == [SWIMMING, RUNNING]
+
+
+def test_process_lines_is_lazy():
+    def lines():
+        yield 'RUN,15000,1,75'
+        raise AssertionError('прочитано больше, чем нужно')
+
+    assert next(streaming.process_lines(lines())) == RUNNING
+
+
+def test_main_reads_file(tmp_path):
+    path = tmp_path / 'packages.jsonl'
+    path.write_text('["RUN", [15000, 1, 75]]\n', encoding='utf-8')
+    with Capturing() as output:
+        streaming.main([str(path)])
+    assert output == [RUNNING]
@@ -0,0 +1,75 @@
+import pytest
+
+import homework
+import timeseries
+
+
+def test_totals_match_package():
+    series = timeseries.WorkoutSeries('RUN', weight=75)
+    series.extend([[4]] * 3600)
+    assert len(series) == 3600
+    assert series.show_training_info() == (
+        homework.read_package('RUN', [14400, 1, 75]).show_training_info())
+
+
+def test_swimming_channels():
+    series = timeseries.WorkoutSeries('SWM', interval=2, weight=80,
+                                      length_pool=25)
+    series.extend_channels(action=[1] * 1800, count_pool=[0.02] * 1800)
+    series.append(0, 0, seconds=0)
+    training = series.training()
+    assert training.duration == 1
+    assert training.action == 1800
+    assert training.count_pool == pytest.approx(36)
+
+
+def test_laps_and_splits():
+    series = timeseries.WorkoutSeries('WLK', weight=75, height=180)
+    series.extend_channels(action=[1] * 100 + [3] * 50)
+    assert series.split_boundaries(60) == [60, 120]
+    splits = series.splits(60)
+    assert [info.duration * 3600 for info in splits] == [60, 60, 30]
+    laps = series.laps([100])
+    assert laps[0] == series.training(0, 100).show_training_info()
+    assert laps[1].distance == pytest.approx(150 * 0.65 / 1000)
+
+
+def test_splits_tolerate_fractional_intervals():
+    series = timeseries.WorkoutSeries('RUN', interval=0.1, weight=75)
+    series.extend_channels(action=[1] * 35)
+    assert series.split_boundaries(1) == [10, 20, 30]
+    durations = [info.duration * 3600 for info in series.splits(1)]
+    assert durations == pytest.approx([1, 1, 1, 0.5])
+
+
+def test_downsample_keeps_totals():
+    series = timeseries.WorkoutSeries('RUN', weight=75)
+    series.extend_channels(action=list(range(1001)))
+    coarse = series.downsample(10)
+    assert len(coarse) == 101
+    assert coarse.interval == 10
+    assert coarse.seconds[-1] == 1
+    assert coarse.totals == series.totals
+    with pytest.raises(ValueError):
+        series.downsample(0)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        timeseries.WorkoutSeries('BIK', weight=75)
+    with pytest.raises(TypeError):
+        timeseries.WorkoutSeries('WLK', weight=75)
+    series = timeseries.WorkoutSeries('RUN', weight=75)
+    with pytest.raises(TypeError):
+        series.append(1, 2)
+    with pytest.raises(TypeError):
+        series.extend_channels(seconds=[1], action=[1, 2])
+    series.append(4)
+    with pytest.raises(TypeError):
+        series.append('x')
+    with pytest.raises(TypeError):
+        series.extend_channels(seconds=[1, 'x'], action=[1, 2])
+    with pytest.raises(TypeError):
+        series.extend_channels(action=[1, None])
+    assert len(series) == len(series.channels['action']) == 1
+    assert series.totals == {'seconds': 1, 'action': 4}
@@ -0,0 +1,66 @@
+import homework
+from validation import InvalidPackage, validate_batch
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('BIK', [1, 2, 3]),
+    ('RUN', [15000, 1]),
+    ('RUN', [15000, 0, 75]),
+    ('WLK', [9000, 1, 75, 0]),
+    ('RUN', [15000, 1, 'x']),
+    ('RUN', [-1, float('nan'), 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def test_validate_batch_mask_and_errors():
+    result = validate_batch(PACKAGES)
+    assert result.mask == [True, False, False, False,
+                           False, False, False, True]
+    assert result.valid_indexes == [0, 7]
+    assert [(error.index, error.field) for error in result.errors] == [
+        (1, None), (2, None), (3, 'duration'), (4, 'height'),
+        (5, 'weight'), (6, 'action'), (6, 'duration'),
+    ]
+    assert result.errors[0] == InvalidPackage(
+        1, 'BIK', None, 'неизвестный тип тренировки')
+
+
+def test_only_valid_trainings_are_built():
+    result = validate_batch(PACKAGES)
+    assert result.trainings == [homework.Swimming(720, 1, 80, 25, 40),
+                                homework.SportsWalking(9000, 1, 75, 180)]
+    assert result.show_training_info()[1].calories == 157.50000000000003
+
+
+def test_empty_batch():
+    result = validate_batch([])
+    assert (result.mask, result.errors, result.trainings) == ([], [], [])
+
+
+def test_malformed_packages_are_reported():
+    from array import array
+    packages = [
+        (['RUN'], [1, 2, 3]),
+        ('RUN', array('d', [15000, 1, 75])),
+        ('RUN', '123'),
+        ('RUN', 15000),
+        ('WLK', [1e205, 1, 75, 180]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [10**400, 1, 75]),
+        ('RUN',),
+        None,
+    ]
+    result = validate_batch(packages)
+    assert result.mask == [False, True, False, False, False, True,
+                           False, False, False]
+    reasons = {error.index: error.reason for error in result.errors}
+    assert reasons[0] == 'неизвестный тип тренировки'
+    assert 'str' in reasons[2] and 'int' in reasons[3]
+    assert reasons[4] == 'результат расчёта вне диапазона чисел'
+    assert reasons[6] == 'ожидается конечное число'
+    assert reasons[7] == reasons[8] == 'ожидается пара (тип, данные)'
+    infos = result.show_training_info()
+    assert infos == [
+        homework.read_package('RUN', [15000, 1, 75]).show_training_info(),
+        homework.read_package('WLK', [9000, 1, 75, 180]).show_training_info()]
@@ -0,0 +1,178 @@
+"""Тренировка из посекундных отсчётов датчиков.
+
+Отсчёты хранятся по каналам в `array('d')`: длительность отсчёта в
+секундах и счётчики за отсчёт (шаги или гребки, для плавания ещё
+проплытые бассейны). Итоги накапливаются при добавлении отсчётов, а
+показатели любого отрезка считаются формулами `homework` по суммам
+каналов, поэтому итог всей тренировки совпадает с расчётом пакета.
+"""
+from array import array
+from bisect import bisect_left
+from dataclasses import fields
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from homework import WORKOUT_TYPES, InfoMessage, Training
+
+SAMPLE_FIELDS: Tuple[str, ...] = ('action', 'count_pool')  # суммируемые
+SECONDS_IN_HOUR: float = 3600
+SPLIT_TOLERANCE: float = 1e-9  # относительная погрешность суммы отсчётов
+
+
+class WorkoutSeries:
+    """Отсчёты одной тренировки с итогами, прореживанием и кругами.
+
+    Постоянные поля тренировки (вес, рост, длина бассейна) передаются
+    при создании, счётчики из `SAMPLE_FIELDS` поступают отсчётами.
+    """
+
+    def __init__(self, workout_type: str, interval: float = 1.0,
+                 **params: float) -> None:
+        if workout_type not in WORKOUT_TYPES:
+            raise ValueError(workout_type)
+        self.workout_type = workout_type
+        self.training_class = WORKOUT_TYPES[workout_type]
+        names = [field.name for field in fields(self.training_class)]
+        self.channel_names = tuple(name for name in names
+                                   if name in SAMPLE_FIELDS)
+        static = [name for name in names
+                  if name not in SAMPLE_FIELDS and name != 'duration']
+        if sorted(params) != sorted(static):
+            raise TypeError(f'Для тренировки {workout_type} нужны '
+                            f'параметры: {", ".join(static)}.')
+        self.params = params
+        self.interval = interval
+        self.seconds = array('d')
+        self.channels: Dict[str, array] = {name: array('d')
+                                           for name in self.channel_names}
+        self.totals: Dict[str, float] = dict.fromkeys(
+            ('seconds',) + self.channel_names, 0.0)
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    def _check_length(self, count: int) -> None:
+        if count != len(self.channel_names):
+            raise TypeError(f'В отсчёте тренировки {self.workout_type} '
+                            f'передано неверное количество элементов: '
+                            f'{count} вместо {len(self.channel_names)}.')
+
+    def append(self, *values: float,
+               seconds: Optional[float] = None) -> None:
+        """Добавить отсчёт: счётчики в порядке `channel_names`.
+
+        Значения сначала переводятся в числа, поэтому ошибочный отсчёт
+        не добавляется ни в один канал.
+        """
+        self._check_length(len(values))
+        row = array('d', (self.interval if seconds is None else seconds,
+                          *values))
+        self.seconds.append(row[0])
+        self.totals['seconds'] += row[0]
+        for name, value in zip(self.channel_names, row[1:]):
+            self.channels[name].append(value)
+            self.totals[name] += value
+
+    def extend(self, samples: Iterable[Sequence[float]]) -> None:
+        """Добавить отсчёты с длительностью `interval`."""
+        for values in samples:
+            self.append(*values)
+
+    def extend_channels(self, seconds: Optional[Sequence[float]] = None,
+                        **channels: Sequence[float]) -> None:
+        """Добавить отсчёты целыми столбцами, без объекта на отсчёт.
+
+        Столбцы переводятся в `array('d')` до добавления, так что при
+        ошибке серия не меняется.
+        """
+        if sorted(channels) != sorted(self.channel_names):
+            raise TypeError(f'Для тренировки {self.workout_type} нужны '
+                            f'каналы: {", ".join(self.channel_names)}.')
+        channels = {name: array('d', column)
+                    for name, column in channels.items()}
+        if seconds is not None:
+            seconds = array('d', seconds)
+        lengths = {len(column) for column in channels.values()}
+        if seconds is not None:
+            lengths.add(len(seconds))
+        if len(lengths) > 1:
+            raise TypeError(f'Каналы тренировки {self.workout_type} '
+                            f'имеют разную длину: {sorted(lengths)}.')
+        count = lengths.pop()
+        if seconds is None:
+            seconds = array('d', [self.interval]) * count
+        self.seconds.extend(seconds)
+        self.totals['seconds'] += sum(seconds)
+        for name, column in channels.items():
+            self.channels[name].extend(column)
+            self.totals[name] += sum(column)
+
+    def _training(self, sums: Dict[str, float]) -> Training:
+        """Тренировка с суммами каналов вместо агрегатов пакета."""
+        values = dict(self.params, **sums)
+        values['duration'] = values.pop('seconds') / SECONDS_IN_HOUR
+        return self.training_class(**values)
+
+    def training(self, start: int = 0,
+                 stop: Optional[int] = None) -> Training:
+        """Тренировка по отсчётам `[start:stop]`; без границ - итог."""
+        if start == 0 and stop is None:
+            return self._training(self.totals)
+        sums = {'seconds': sum(self.seconds[start:stop])}
+        for name in self.channel_names:
+            sums[name] = sum(self.channels[name][start:stop])
+        return self._training(sums)
+
+    def show_training_info(self) -> InfoMessage:
+        """Информационное сообщение о всей тренировке."""
+        return self.training().show_training_info()
+
+    def laps(self, boundaries: Sequence[int]) -> List[InfoMessage]:
+        """Сообщения по кругам, разделённым номерами отсчётов."""
+        edges = [0, *boundaries, len(self)]
+        return [self.training(start, stop).show_training_info()
+                for start, stop in zip(edges, edges[1:]) if stop > start]
+
+    def split_boundaries(self, seconds: float) -> List[int]:
+        """Номера отсчётов, с которых начинается каждый отрезок `seconds`.
+
+        Отсчёт относится к отрезку, в котором он закончился. Накопленное
+        время сравнивается с границей с допуском `SPLIT_TOLERANCE`:
+        сумма десяти отсчётов по 0,1 с должна закрывать секунду.
+        """
+        elapsed = array('d', accumulate(self.seconds))
+        if not elapsed:
+            return []
+        slack = 1 - SPLIT_TOLERANCE
+        count = int(elapsed[-1] / (seconds * slack))
+        return [bisect_left(elapsed, seconds * (number + 1) * slack) + 1
+                for number in range(count)]
+
+    def splits(self, seconds: float) -> List[InfoMessage]:
+        """Сообщения по отрезкам заданной длительности."""
+        return self.laps(self.split_boundaries(seconds))
+
+    def downsample(self, factor: int) -> 'WorkoutSeries':
+        """Новая серия, где каждые `factor` отсчётов сложены в один.
+
+        Суммы каналов и длительность сохраняются, последний отсчёт
+        может быть короче остальных.
+        """
+        if factor < 1:
+            raise ValueError(f'Коэффициент прореживания должен быть '
+                             f'положительным: {factor}.')
+        series = WorkoutSeries(self.workout_type, self.interval * factor,
+                               **self.params)
+        columns = {name: array('d', _window_sums(self.channels[name],
+                                                 factor))
+                   for name in self.channel_names}
+        series.extend_channels(array('d', _window_sums(self.seconds,
+                                                       factor)),
+                               **columns)
+        return series
+
+
+def _window_sums(column: array, factor: int) -> Iterable[float]:
+    """Суммы подряд идущих окон по `factor` значений."""
+    return (sum(column[start:start + factor])
+            for start in range(0, len(column), factor))
@@ -0,0 +1,267 @@
+"""Проверка пакетов целиком до создания объектов тренировок.
+
+Вместо исключения на каждый плохой пакет проверки выполняются по
+столбцам для всего набора сразу, результат - маска годных строк и
+список ошибок. Годные строки рассчитываются пакетно, объекты
+`Training` создаются только по запросу и только для годных строк.
+"""
+import math
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass, field, fields
+from numbers import Real
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from batch import Results, compute_batch, results_to_info
+from homework import WORKOUT_ARITY, WORKOUT_TYPES, InfoMessage, Training
+
+Package = Tuple[str, Sequence[float]]
+
+NUMBER_TYPES = (int, float)
+METRIC_NAMES = ('distance', 'speed', 'calories')
+
+RANGES: Dict[str, Tuple[float, bool]] = {
+    'action': (0, False),
+    'duration': (0, True),
+    'weight': (0, True),
+    'height': (0, True),
+    'length_pool': (0, False),
+    'count_pool': (0, False),
+}  # поле: (нижняя граница, строго больше)
+
+
+@dataclass
+class InvalidPackage:
+    """Ошибка в пакете: номер, тип, поле (если известно) и причина."""
+
+    index: int
+    workout_type: Optional[str]
+    field: Optional[str]
+    reason: str
+
+
+@dataclass
+class ValidationResult:
+    """Маска годных пакетов и ошибки в остальных."""
+
+    packages: Sequence[Package] = field(repr=False)
+    mask: List[bool]
+    errors: List[InvalidPackage] = field(default_factory=list)
+    computed: Optional[Dict[str, Tuple[List[int], Results]]] = field(
+        default=None, repr=False)
+
+    @property
+    def valid_indexes(self) -> List[int]:
+        """Номера годных пакетов."""
+        return [index for index, valid in enumerate(self.mask) if valid]
+
+    @property
+    def trainings(self) -> List[Training]:
+        """Тренировки для годных пакетов, в порядке `valid_indexes`."""
+        packages = self.packages
+        return [WORKOUT_TYPES[packages[index][0]](*packages[index][1])
+                for index in self.valid_indexes]
+
+    def groups(self) -> Dict[str, List[int]]:
+        """Номера годных пакетов по типам тренировок."""
+        groups: Dict[str, List[int]] = {}
+        for index in self.valid_indexes:
+            groups.setdefault(self.packages[index][0], []).append(index)
+        return groups
+
+    def compute(self) -> Dict[str, Tuple[List[int], Results]]:
+        """Пакетно рассчитать годные строки каждого типа."""
+        if self.computed is not None:
+            return self.computed
+        computed = {}
+        for workout_type, indexes in self.groups().items():
+            names = [item.name
+                     for item in fields(WORKOUT_TYPES[workout_type])]
+            columns = dict(zip(names, zip(*(self.packages[index][1]
+                                            for index in indexes))))
+            computed[workout_type] = (indexes,
+                                      compute_batch(workout_type, columns))
+        return computed
+
+    def show_training_info(self) -> List[InfoMessage]:
+        """Информационные сообщения для годных пакетов по порядку."""
+        infos: List[Optional[InfoMessage]] = [None] * len(self.packages)
+        for workout_type, (indexes, results) in self.compute().items():
+            messages = results_to_info(WORKOUT_TYPES[workout_type], results)
+            for index, info in zip(indexes, messages):
+                infos[index] = info
+        return [info for info in infos if info is not None]
+
+
+def _is_real(value: object) -> bool:
+    """Число, отличное от `int` и `float`, но не `bool`."""
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _is_number(value: object) -> bool:
+    """Конечное вещественное число, но не `bool`."""
+    try:
+        return ((type(value) in NUMBER_TYPES or _is_real(value))
+                and math.isfinite(value))
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _in_range(value: object, lower: float, strict: bool) -> bool:
+    """Проверить одно значение, не поднимая исключений.
+
+    Используется, если проверка всего столбца упала, например на целом
+    числе вне диапазона `float`.
+    """
+    try:
+        return _is_number(value) and (value > lower if strict
+                                      else value >= lower)
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _check_column(workout_type: str, name: str, indexes: List[int],
+                  column: Sequence[object],
+                  errors: List[InvalidPackage]) -> List[int]:
+    """Вернуть позиции в столбце, не прошедшие проверку.
+
+    Столбец проходится один раз, причина ошибки уточняется только для
+    отбракованных значений.
+    """
+    isfinite = math.isfinite
+    lower, strict = RANGES.get(name, (-math.inf, False))
+    try:
+        if strict:
+            bad = [position for position, value in enumerate(column)
+                   if not (type(value) in NUMBER_TYPES or _is_real(value))
+                   or not isfinite(value) or not value > lower]
+        else:
+            bad = [position for position, value in enumerate(column)
+                   if not (type(value) in NUMBER_TYPES or _is_real(value))
+                   or not isfinite(value) or not value >= lower]
+    except (TypeError, ValueError, OverflowError):
+        bad = [position for position, value in enumerate(column)
+               if not _in_range(value, lower, strict)]
+    reason = (f'должно быть больше {lower}' if strict
+              else f'не может быть меньше {lower}')
+    for position in bad:
+        errors.append(InvalidPackage(
+            indexes[position], workout_type, name,
+            reason if _is_number(column[position])
+            else 'ожидается конечное число'))
+    return bad
+
+
+def _package_reason(workout_type: object, data: object) -> Optional[str]:
+    """Причина, по которой пакет нельзя разложить по столбцам."""
+    try:
+        known = workout_type in WORKOUT_ARITY
+    except TypeError:
+        known = False
+    if not known:
+        return 'неизвестный тип тренировки'
+    if (not isinstance(data, SequenceABC)
+            or isinstance(data, (str, bytes, bytearray))):
+        return (f'ожидается последовательность чисел, получено '
+                f'{type(data).__name__}')
+    if len(data) != WORKOUT_ARITY[workout_type]:
+        return (f'ожидается {WORKOUT_ARITY[workout_type]} значений, '
+                f'получено {len(data)}')
+    return None
+
+
+def _compute_checked(workout_type: str, rows: List[Sequence[float]]
+                     ) -> Tuple[Results, List[int]]:
+    """Рассчитать строки и найти те, где результат не конечен.
+
+    Если пакетный расчёт падает на переполнении, строки считаются по
+    одной, чтобы найти виновные.
+    """
+    names = [item.name for item in fields(WORKOUT_TYPES[workout_type])]
+    try:
+        results = compute_batch(workout_type, dict(zip(names, zip(*rows))))
+    except ArithmeticError:
+        results = {name: [] for name in ('duration',) + METRIC_NAMES}
+        for row in rows:
+            try:
+                single = compute_batch(workout_type,
+                                       dict(zip(names, zip(row))))
+            except ArithmeticError:
+                single = {name: [math.nan]
+                          for name in ('duration',) + METRIC_NAMES}
+            for name, column in results.items():
+                column.extend(single[name])
+    isfinite = math.isfinite
+    bad = [position for position, values
+           in enumerate(zip(*(results[name] for name in METRIC_NAMES)))
+           if not all(map(isfinite, values))]
+    return results, bad
+
+
+def _validate_group(result: ValidationResult, workout_type: str,
+                    indexes: List[int]) -> None:
+    """Проверить столбцы пакетов одного типа и рассчитать годные."""
+    packages = result.packages
+    names = [item.name for item in fields(WORKOUT_TYPES[workout_type])]
+    columns = zip(*(packages[index][1] for index in indexes))
+    for name, column in zip(names, columns):
+        for position in _check_column(workout_type, name, indexes, column,
+                                      result.errors):
+            result.mask[indexes[position]] = False
+    valid = [index for index in indexes if result.mask[index]]
+    if not valid:
+        return
+    results, bad = _compute_checked(
+        workout_type, [packages[index][1] for index in valid])
+    for position in bad:
+        result.mask[valid[position]] = False
+        result.errors.append(InvalidPackage(
+            valid[position], workout_type, None,
+            'результат расчёта вне диапазона чисел'))
+    if bad:
+        keep = [position for position, index in enumerate(valid)
+                if result.mask[index]]
+        valid = [valid[position] for position in keep]
+        results = {name: [column[position] for position in keep]
+                   for name, column in results.items()}
+    if valid:
+        result.computed[workout_type] = (valid, results)
+
+
+def validate_batch(packages: Sequence[Package]) -> ValidationResult:
+    """Проверить набор пакетов и рассчитать годные.
+
+    Кроме значений полей проверяется результат: пакет, на котором
+    расчёт переполняется или даёт бесконечность, тоже считается
+    ошибочным.
+    """
+    result = ValidationResult(packages, [True] * len(packages))
+    groups: Dict[str, List[int]] = {workout_type: []
+                                    for workout_type in WORKOUT_TYPES}
+    arity = WORKOUT_ARITY
+    for index, package in enumerate(packages):
+        try:
+            workout_type, data = package
+        except (TypeError, ValueError):
+            result.mask[index] = False
+            result.errors.append(InvalidPackage(
+                index, None, None, 'ожидается пара (тип, данные)'))
+            continue
+        if (type(workout_type) is str and workout_type in arity
+                and type(data) in (list, tuple)
+                and len(data) == arity[workout_type]):
+            groups[workout_type].append(index)
+            continue
+        reason = _package_reason(workout_type, data)
+        if reason is None:
+            groups[workout_type].append(index)
+            continue
+        result.mask[index] = False
+        result.errors.append(InvalidPackage(index, workout_type, None,
+                                            reason))
+
+    result.computed = {}
+    for workout_type, indexes in groups.items():
+        if indexes:
+            _validate_group(result, workout_type, indexes)
+    result.errors.sort(key=lambda error: error.index)
+    return result